@@ -1,9 +1,11 @@
 import os
 import signal
+import time
 from collections import deque
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from rich.style import Style
 from rich.text import Text
 
 from textual import work
@@ -28,6 +30,8 @@ from .data import (
     session_status,
 )
 from .kanban import (
+    STAGE_INDEX,
+    STAGE_SET,
     STAGES,
     STAGE_LABELS,
     KanbanProject,
@@ -75,15 +79,32 @@ STATUS_ICONS = {
     "old": _O,
 }
 
+# (depth, is_last_child) -> tree glyphs drawn before a session's status icon
+_TREE_PREFIX = {
+    (1, False): "\u251c\u2500 ",
+    (1, True): "\u2514\u2500 ",
+    (2, False): "\u2502  \u251c\u2500 ",
+    (2, True): "\u2502  \u2514\u2500 ",
+}
+
 STAGE_ICONS = {
     "pending": _SQ_O,
     "in_progress": _SPIN,
     "done": _CHECK_CIRCLE,
 }
 
+# Parsed once so Text.append doesn't re-parse style strings per card/row
+_STYLE_BOLD = Style(bold=True)
+_STYLE_DIM = Style(dim=True)
+_STYLE_DIM_ITALIC = Style(dim=True, italic=True)
+
 ACTIVE_WORKER_WINDOW = timedelta(minutes=3)
 COMMS_MAX_EVENTS = 16
 MEM_KILL_THRESHOLD_MB = 8192
+REFRESH_DEBOUNCE_SECONDS = 0.1
+LOG_RESCAN_SECONDS = 2.0
+LOG_BACKFILL_BYTES = 8192
+LOG_CATCHUP_BYTES = 64 * 1024
 
 MODE_NORMAL = "normal"
 MODE_ADD_TITLE = "add_title"
@@ -93,6 +114,14 @@ MODE_UNLINK_SESSION = "unlink_session"
 MODE_LINK_PR = "link_pr"
 
 
+def _truncate(text, width):
+    # type: (str, int) -> str
+    """Clip text to width characters, ending in '...' when shortened."""
+    if len(text) <= width:
+        return text
+    return text[: width - 3] + "..."
+
+
 # ══════════════════════════════════════════════════════════
 #  KanbanList — OptionList with vim keys
 # ══════════════════════════════════════════════════════════
@@ -159,13 +188,15 @@ class SessionsScreen(Screen):
         a = self._app_ref
         table = self.query_one("#sessions-body", DataTable)
         table.clear()
+        now = datetime.now()
 
+        # Walking backwards, the first child seen per parent is its last one
         last_child = {}  # type: dict
-        for session in a._sessions:
+        for session in reversed(a._sessions):
             if session.depth == 1:
-                last_child[session.directory] = session.id
+                last_child.setdefault(session.directory, session.id)
             elif session.depth == 2 and session.parent_id:
-                last_child[session.parent_id] = session.id
+                last_child.setdefault(session.parent_id, session.id)
 
         for session in a._sessions:
             if session.is_group_header:
@@ -178,31 +209,29 @@ class SessionsScreen(Screen):
             status = session_status(session, cpu)
             icon = STATUS_ICONS.get(status, _O)
             workers = a._workers_by_session.get(session.id, [])
-            active_w = sum(
-                1
-                for w in workers
-                if session.id in a._running_cpu
-                and (datetime.now() - w.updated) <= ACTIVE_WORKER_WINDOW
-            )
-            workers_text = "%s/%s" % (active_w, len(workers)) if workers else "-"
+            if cpu is not None:
+                active_w = sum(
+                    1 for w in workers if (now - w.updated) <= ACTIVE_WORKER_WINDOW
+                )
+            else:
+                active_w = 0
+            workers_text = f"{active_w}/{len(workers)}" if workers else "-"
             mem = a._mem_by_session.get(session.id, 0)
             if mem >= 1024:
-                mem_text = "%.1fGB" % (mem / 1024.0)
+                mem_text = f"{mem / 1024.0:.1f}GB"
             elif mem > 0:
-                mem_text = "%dMB" % mem
+                mem_text = f"{mem}MB"
             else:
                 mem_text = "-"
             cost = a._cost_by_session.get(session.id)
-            cost_text = "$%.0f" % cost if cost and cost >= 1 else "-"
+            cost_text = f"${cost:.0f}" if cost and cost >= 1 else "-"
 
             if session.depth == 1:
                 is_last = last_child.get(session.directory) == session.id
-                branch = "\u2514\u2500 " if is_last else "\u251c\u2500 "
-                display_icon = branch + icon
+                display_icon = _TREE_PREFIX[1, is_last] + icon
             elif session.depth == 2:
                 is_last = last_child.get(session.parent_id) == session.id
-                branch = "\u2502  \u2514\u2500 " if is_last else "\u2502  \u251c\u2500 "
-                display_icon = branch + icon
+                display_icon = _TREE_PREFIX[2, is_last] + icon
             else:
                 display_icon = icon
 
@@ -222,8 +251,8 @@ class SessionsScreen(Screen):
         if session.total == 0:
             return "-"
         if session.pending == 0 and session.in_progress == 0:
-            return "%s/%s %s" % (session.completed, session.total, _CHECK)
-        return "%s/%s" % (session.completed, session.total)
+            return f"{session.completed}/{session.total} {_CHECK}"
+        return f"{session.completed}/{session.total}"
 
     def action_pop_screen(self) -> None:
         self.app.pop_screen()
@@ -371,25 +400,25 @@ class ArchiveScreen(Screen):
             title = project.title
             if len(title) > 40:
                 title = title[:37] + "..."
-            label.append(title, style="bold")
+            label.append(title, style=_STYLE_BOLD)
             if project.description:
                 desc = project.description
                 if len(desc) > 50:
                     desc = desc[:47] + "..."
                 label.append("\n")
-                label.append(desc, style="dim")
+                label.append(desc, style=_STYLE_DIM)
             restore_to = project.previous_stage or "done"
             restore_label = STAGE_LABELS.get(restore_to, restore_to)
             label.append("\n")
             label.append(
                 "archived %s  \u2192 %s" % (project.updated_at[:10], restore_label),
-                style="dim italic",
+                style=_STYLE_DIM_ITALIC,
             )
             ol.add_option(Option(label, id=project.id))
         if ol.option_count > 0:
             ol.highlighted = 0
         elif ol.option_count == 0:
-            ol.add_option(Option(Text("(empty)", style="dim")))
+            ol.add_option(Option(Text("(empty)", style=_STYLE_DIM)))
         ol.focus()
 
     def action_pop_screen(self) -> None:
@@ -462,37 +491,37 @@ class SearchScreen(Screen):
         ol = self.query_one("#search-results", OptionList)
         ol.clear_options()
         if not self._results:
-            ol.add_option(Option(Text("(no results)", style="dim")))
+            ol.add_option(Option(Text("(no results)", style=_STYLE_DIM)))
             return
         for result in self._results:
             label = Text()
             if result.kind == "project":
                 icon = STAGE_ICONS.get(result.stage, _O)
                 stage_text = STAGE_LABELS.get(result.stage, result.stage)
-                label.append("%s " % icon, style="bold")
+                label.append("%s " % icon, style=_STYLE_BOLD)
                 title = result.title
                 if len(title) > 50:
                     title = title[:47] + "..."
-                label.append(title, style="bold")
+                label.append(title, style=_STYLE_BOLD)
                 label.append("  ")
-                label.append(stage_text, style="dim italic")
+                label.append(stage_text, style=_STYLE_DIM_ITALIC)
                 if result.pr_numbers:
                     prs = ", ".join("#%d" % pr for pr in result.pr_numbers)
-                    label.append("  %s" % prs, style="dim")
+                    label.append("  %s" % prs, style=_STYLE_DIM)
                 if result.detail and result.detail != stage_text:
                     label.append("\n")
                     detail = result.detail
                     if len(detail) > 60:
                         detail = detail[:57] + "..."
-                    label.append("  %s" % detail, style="dim")
+                    label.append("  %s" % detail, style=_STYLE_DIM)
             else:
-                label.append("%s " % _TERM, style="bold")
+                label.append("%s " % _TERM, style=_STYLE_BOLD)
                 title = result.title
                 if len(title) > 50:
                     title = title[:47] + "..."
-                label.append(title, style="bold")
+                label.append(title, style=_STYLE_BOLD)
                 label.append("\n")
-                label.append("  %s" % result.id[:24], style="dim")
+                label.append("  %s" % result.id[:24], style=_STYLE_DIM)
             ol.add_option(Option(label, id=result.id))
         if ol.option_count > 0:
             ol.highlighted = 0
@@ -562,15 +591,29 @@ class OCDashboardApp(App[None]):
         self._wal_mtime = None  # type: Optional[float]
         self._log_path = None  # type: Optional[str]
         self._log_handle = None  # type: Optional[Any]
+        self._log_scanned_at = 0.0  # monotonic time of last find_latest_log
         self._log_events = deque(maxlen=COMMS_MAX_EVENTS)  # type: deque[LogEvent]
         self._error_flash_until = None  # type: Optional[datetime]
+        self._last_topbar_key = None  # type: Optional[tuple]
+        self._branch_display = ("", "")  # (branch, truncated form)
+        self._wheel_key = None  # type: Optional[tuple]
+        self._detail_key = None  # type: Optional[tuple]
         self._watchdog_warned = set()  # type: set[int]
+        self._kanban_save_error = None  # type: Optional[str]
         self._mode = MODE_NORMAL
         self._pending_title = ""
         self._last_focused_stage = "pending"
         self._focus_project_after_search = None  # type: Optional[str]
         self._pending_focus_stage = None  # type: Optional[str]
         self._pending_focus_project = None  # type: Optional[str]
+        self._refresh_pending = False
+        self._submit_handlers = {
+            MODE_ADD_TITLE: self._submit_add_title,
+            MODE_ADD_DESC: self._submit_add_desc,
+            MODE_LINK_SESSION: self._submit_link_session,
+            MODE_UNLINK_SESSION: self._submit_unlink_session,
+            MODE_LINK_PR: self._submit_link_pr,
+        }
 
     # ── State accessors (delegate to Dashboard) ────────────
 
@@ -604,6 +647,11 @@ class OCDashboardApp(App[None]):
         # type: () -> Dict[str, float]
         return self._dashboard.state.cost_by_session
 
+    @property
+    def _total_cpu(self):
+        # type: () -> float
+        return self._dashboard.state.total_cpu
+
     @property
     def _total_cost(self):
         # type: () -> float
@@ -649,7 +697,7 @@ class OCDashboardApp(App[None]):
         self._refresh_kanban()
         self._render_topbar()
         self._render_footerbar()
-        _ = self.refresh_dashboard()
+        self.refresh_dashboard()
         self.set_interval(2, self._tick)
         self.set_interval(0.5, self._poll_log)
         self.set_interval(3, self._check_wal)
@@ -686,8 +734,9 @@ class OCDashboardApp(App[None]):
 
     # ── Live features ──────────────────────────────────────────────────
 
-    def _open_latest_log(self) -> None:
-        latest = find_latest_log()
+    def _open_latest_log(self, latest: Optional[str] = None) -> None:
+        if latest is None:
+            latest = find_latest_log()
         if not latest:
             return
         if self._log_path == latest and self._log_handle is not None:
@@ -702,7 +751,7 @@ class OCDashboardApp(App[None]):
             try:
                 fh.seek(0, 2)
                 end_pos = fh.tell()
-                backfill_pos = max(0, end_pos - 8192)
+                backfill_pos = max(0, end_pos - LOG_BACKFILL_BYTES)
                 fh.seek(backfill_pos)
                 if backfill_pos > 0:
                     fh.readline()
@@ -723,13 +772,27 @@ class OCDashboardApp(App[None]):
             self._log_path = None
 
     def _poll_log(self) -> None:
-        latest = find_latest_log()
-        if latest and latest != self._log_path:
-            self._open_latest_log()
+        # Reading the open handle is cheap; globbing LOG_DIR for a newer
+        # log file only needs to happen every few polls
+        mono = time.monotonic()
+        if mono - self._log_scanned_at >= LOG_RESCAN_SECONDS:
+            self._log_scanned_at = mono
+            latest = find_latest_log()
+            if latest and latest != self._log_path:
+                self._open_latest_log(latest)
         if self._log_handle is None:
             return
         new_events = False
+        now = datetime.now()
         try:
+            fh = self._log_handle
+            end_pos = os.fstat(fh.fileno()).st_size
+            if end_pos - fh.tell() > LOG_CATCHUP_BYTES:
+                # Far behind (e.g. after a stall): only the newest events
+                # survive in the deque, so jump to the tail like the
+                # initial backfill instead of parsing the whole backlog
+                fh.seek(end_pos - LOG_BACKFILL_BYTES)
+                fh.readline()
             for _ in range(200):
                 line = self._log_handle.readline()
                 if not line:
@@ -744,12 +807,12 @@ class OCDashboardApp(App[None]):
                     if to_branch and to_branch != "HEAD":
                         self._current_branch = to_branch
                 if event.event_type == "session.error":
-                    self._error_flash_until = datetime.now() + timedelta(seconds=5)
+                    self._error_flash_until = now + timedelta(seconds=5)
         except Exception:
             self._log_handle = None
             self._log_path = None
         if new_events:
-            self._render_topbar()
+            self._render_topbar(now)
 
     def _check_wal(self) -> None:
         new_mtime = get_wal_mtime()
@@ -757,18 +820,23 @@ class OCDashboardApp(App[None]):
             return
         if self._wal_mtime is None or new_mtime > self._wal_mtime:
             self._wal_mtime = new_mtime
-            _ = self.refresh_dashboard()
+            self.refresh_dashboard()
 
     def _watchdog(self) -> None:
         try:
             processes = fetch_running_processes()
         except Exception:
             return
+        offenders = [p for p in processes if p.mem_mb >= MEM_KILL_THRESHOLD_MB]
+        if self._watchdog_warned:
+            # Forget warnings for processes that dropped back under the limit
+            self._watchdog_warned -= {p.pid for p in processes} - {
+                p.pid for p in offenders
+            }
         killed_any = False
-        for proc in processes:
-            if proc.mem_mb < MEM_KILL_THRESHOLD_MB:
-                self._watchdog_warned.discard(proc.pid)
-                continue
+        now = datetime.now()
+        time_str = now.strftime("%H:%M:%S")
+        for proc in offenders:
             session_label = "unknown session"
             if proc.session_id:
                 for s in self._sessions:
@@ -800,25 +868,45 @@ class OCDashboardApp(App[None]):
                 self._watchdog_warned.add(proc.pid)
             self._log_events.append(
                 LogEvent(
-                    time_str=datetime.now().strftime("%H:%M:%S"),
+                    time_str=time_str,
                     event_type="watchdog.kill",
                     fields={"detail": msg},
                 )
             )
             killed_any = True
         if killed_any:
-            self._error_flash_until = datetime.now() + timedelta(seconds=10)
-            self._render_topbar()
+            self._error_flash_until = now + timedelta(seconds=10)
+            self._render_topbar(now)
 
     def _tick(self) -> None:
         self._tick_count += 1
-        self._render_topbar()
+        now = datetime.now()
+        self._check_kanban_save(now)
+        self._render_topbar(now)
+
+    def _check_kanban_save(self, now):
+        # type: (datetime) -> None
+        """Flash and log once when the board's background save starts failing."""
+        error = self._dashboard.kanban.save_error
+        if error == self._kanban_save_error:
+            return
+        self._kanban_save_error = error
+        if not error:
+            return
+        self._error_flash_until = now + timedelta(seconds=10)
+        self._log_events.append(
+            LogEvent(
+                time_str=now.strftime("%H:%M:%S"),
+                event_type="kanban.save_failed",
+                fields={"detail": "Kanban save failed, retrying: %s" % error},
+            )
+        )
 
     # ── Actions ────────────────────────────────────────────────────────
 
     def action_refresh(self) -> None:
         self._refresh_kanban()
-        _ = self.refresh_dashboard()
+        self.refresh_dashboard()
 
     def action_show_sessions(self) -> None:
         if self._mode != MODE_NORMAL:
@@ -859,7 +947,7 @@ class OCDashboardApp(App[None]):
         project = self._selected_project()
         if not project:
             return
-        idx = STAGES.index(project.stage)
+        idx = STAGE_INDEX[project.stage]
         if idx < len(STAGES) - 1:
             self._dashboard.kanban.move_project(project.id, STAGES[idx + 1])
             self._refresh_kanban()
@@ -870,7 +958,7 @@ class OCDashboardApp(App[None]):
         project = self._selected_project()
         if not project:
             return
-        idx = STAGES.index(project.stage)
+        idx = STAGE_INDEX[project.stage]
         if idx > 0:
             self._dashboard.kanban.move_project(project.id, STAGES[idx - 1])
             self._refresh_kanban()
@@ -976,19 +1064,22 @@ class OCDashboardApp(App[None]):
         wheel_items = self._dashboard.wheel_list()
         if not wheel_items:
             pane.add_class("hidden")
+            self._wheel_key = None
             return
-        pane.remove_class("hidden")
         current = self._dashboard.wheel_current()
         current_id = current.id if current else None
+        key = (tuple((p.id, p.title) for p in wheel_items), current_id)
+        if key == self._wheel_key:
+            return
+        self._wheel_key = key
+        pane.remove_class("hidden")
         parts = []  # type: list
         for project in wheel_items:
-            title = project.title
-            if len(title) > 24:
-                title = title[:21] + "..."
+            title = _truncate(project.title, 24)
             if project.id == current_id:
-                parts.append("[bold #00ff41]\u25b8 %s \u25c2[/]" % title)
+                parts.append(f"[bold #00ff41]\u25b8 {title} \u25c2[/]")
             else:
-                parts.append("[dim]%s[/]" % title)
+                parts.append(f"[dim]{title}[/]")
         text = " \u25c0  %s  \u25b6" % ("  %s  " % _PIPE).join(parts)
         pane.update(text)
 
@@ -998,7 +1089,7 @@ class OCDashboardApp(App[None]):
         if not target_id:
             return
         project = self._dashboard.kanban.get_project(target_id)
-        if not project or project.stage not in STAGES:
+        if not project or project.stage not in STAGE_SET:
             return
         self._pending_focus_stage = project.stage
         self._pending_focus_project = target_id
@@ -1039,85 +1130,87 @@ class OCDashboardApp(App[None]):
 
     def on_input_submitted(self, event):
         # type: (Input.Submitted) -> None
-        value = event.value.strip()
-
-        if self._mode == MODE_ADD_TITLE:
-            if value:
-                self._pending_title = value
-                self._mode = MODE_ADD_DESC
-                self._show_input(
-                    "Description (becomes the agent's initial prompt):",
-                    "What to build, context, constraints...",
-                )
-            else:
-                self._hide_input()
+        handler = self._submit_handlers.get(self._mode)
+        if handler is None:
+            self._hide_input()
             return
+        handler(event.value.strip())
 
-        if self._mode == MODE_ADD_DESC:
-            stage = self._last_focused_stage or "pending"
-            project = self._dashboard.kanban.create_project(
-                title=self._pending_title,
-                description=value,
-                stage=stage,
+    def _submit_add_title(self, value):
+        # type: (str) -> None
+        if value:
+            self._pending_title = value
+            self._mode = MODE_ADD_DESC
+            self._show_input(
+                "Description (becomes the agent's initial prompt):",
+                "What to build, context, constraints...",
             )
-            self._pending_title = ""
+        else:
             self._hide_input()
-            self._refresh_kanban()
-            project_path = None
-            if self._snapshot:
-                project_path = self._snapshot.project_path
-            self._seed_and_open_session(project, project_path)
-            return
 
-        if self._mode == MODE_LINK_SESSION:
-            if value:
-                project = self._selected_project()
-                if project:
-                    matched = None
-                    for s in self._sessions:
-                        if (
-                            s.id == value
-                            or value in s.id
-                            or value.lower() in s.title.lower()
-                        ):
-                            matched = s.id
-                            break
-                    if matched:
-                        self._dashboard.kanban.link_session(project.id, matched)
-                    else:
-                        self._dashboard.kanban.link_session(project.id, value)
-            self._hide_input()
-            self._refresh_kanban()
-            return
+    def _submit_add_desc(self, value):
+        # type: (str) -> None
+        stage = self._last_focused_stage or "pending"
+        project = self._dashboard.kanban.create_project(
+            title=self._pending_title,
+            description=value,
+            stage=stage,
+        )
+        self._pending_title = ""
+        self._hide_input()
+        self._refresh_kanban()
+        project_path = None
+        if self._snapshot:
+            project_path = self._snapshot.project_path
+        self._seed_and_open_session(project, project_path)
 
-        if self._mode == MODE_UNLINK_SESSION:
-            if value:
-                project = self._selected_project()
-                if project:
-                    matched = None
-                    for sid in project.session_ids:
-                        if sid == value or value in sid:
-                            matched = sid
-                            break
-                    self._dashboard.kanban.unlink_session(project.id, matched or value)
-            self._hide_input()
-            self._refresh_kanban()
-            return
+    def _submit_link_session(self, value):
+        # type: (str) -> None
+        if value:
+            project = self._selected_project()
+            if project:
+                matched = None
+                for s in self._sessions:
+                    if (
+                        s.id == value
+                        or value in s.id
+                        or value.lower() in s.title.lower()
+                    ):
+                        matched = s.id
+                        break
+                if matched:
+                    self._dashboard.kanban.link_session(project.id, matched)
+                else:
+                    self._dashboard.kanban.link_session(project.id, value)
+        self._hide_input()
+        self._refresh_kanban()
 
-        if self._mode == MODE_LINK_PR:
-            if value:
-                project = self._selected_project()
-                if project:
-                    try:
-                        pr_num = int(value.lstrip("#"))
-                        self._dashboard.kanban.link_pr(project.id, pr_num)
-                    except ValueError:
-                        pass
-            self._hide_input()
-            self._refresh_kanban()
-            return
+    def _submit_unlink_session(self, value):
+        # type: (str) -> None
+        if value:
+            project = self._selected_project()
+            if project:
+                matched = None
+                for sid in project.session_ids:
+                    if sid == value or value in sid:
+                        matched = sid
+                        break
+                self._dashboard.kanban.unlink_session(project.id, matched or value)
+        self._hide_input()
+        self._refresh_kanban()
 
+    def _submit_link_pr(self, value):
+        # type: (str) -> None
+        if value:
+            project = self._selected_project()
+            if project:
+                try:
+                    pr_num = int(value.lstrip("#"))
+                    self._dashboard.kanban.link_pr(project.id, pr_num)
+                except ValueError:
+                    pass
         self._hide_input()
+        self._refresh_kanban()
 
     def on_key(self, event) -> None:
         if self._mode != MODE_NORMAL:
@@ -1138,24 +1231,36 @@ class OCDashboardApp(App[None]):
 
     # ── Data ───────────────────────────────────────────────────────────
 
-    @work(thread=True, exclusive=True)
     def refresh_dashboard(self) -> None:
+        """Schedule a snapshot rebuild, coalescing bursts of triggers."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.set_timer(REFRESH_DEBOUNCE_SECONDS, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_pending = False
+        self._build_snapshot_worker()
+
+    @work(thread=True, exclusive=True)
+    def _build_snapshot_worker(self) -> None:
         self._dashboard.refresh_snapshot()
         self.call_from_thread(self._on_snapshot_applied)
 
     def _on_snapshot_applied(self) -> None:
         prev = self._dashboard.state.prev_ci_fail_count
         ci_fails = self._dashboard.ci_fail_count()
+        now = datetime.now()
         if ci_fails > prev and ci_fails > 0:
-            self._error_flash_until = datetime.now() + timedelta(seconds=10)
+            self._error_flash_until = now + timedelta(seconds=10)
             self._log_events.append(
                 LogEvent(
-                    time_str=datetime.now().strftime("%H:%M:%S"),
+                    time_str=now.strftime("%H:%M:%S"),
                     event_type="ci.failed",
                     fields={"detail": "%d PR(s) failing CI" % ci_fails},
                 )
             )
-        self._render_topbar()
+        self._render_topbar(now)
         self._render_detail()
 
     # ── Kanban data ────────────────────────────────────────────────────
@@ -1223,42 +1328,68 @@ class OCDashboardApp(App[None]):
         title = project.title
         if len(title) > 30:
             title = title[:27] + "..."
-        card.append(title, style="bold")
+        card.append(title, style=_STYLE_BOLD)
         # Description line
         if project.description:
             desc = project.description
             if len(desc) > 34:
                 desc = desc[:31] + "..."
             card.append("\n")
-            card.append(desc, style="dim")
+            card.append(desc, style=_STYLE_DIM)
         # Meta line — sessions, PRs, tags
         meta_parts = []  # type: list
         if project.session_ids:
-            meta_parts.append("%s %d" % (_TERM, len(project.session_ids)))
+            meta_parts.append(f"{_TERM} {len(project.session_ids)}")
         if project.pr_numbers:
-            pr_labels = ["#%d" % n for n in project.pr_numbers[:3]]
-            meta_parts.append("%s %s" % (_FORK, " ".join(pr_labels)))
+            pr_labels = [f"#{n}" for n in project.pr_numbers[:3]]
+            meta_parts.append(f"{_FORK} {' '.join(pr_labels)}")
         if project.tags:
             tag_labels = project.tags[:3]
-            meta_parts.append("%s %s" % (_TAG, " ".join(tag_labels)))
+            meta_parts.append(f"{_TAG} {' '.join(tag_labels)}")
         if meta_parts:
             card.append("\n")
-            card.append("  ".join(meta_parts), style="dim italic")
+            card.append("  ".join(meta_parts), style=_STYLE_DIM_ITALIC)
         return card
 
-    def _render_topbar(self) -> None:
+    def _render_topbar(self, now=None):
+        # type: (Optional[datetime]) -> None
+        if now is None:
+            now = datetime.now()
         spinner = _HG[self._tick_count % len(_HG)]
-        now_text = datetime.now().strftime("%H:%M:%S")
-        live = sum(1 for s in self._sessions if s.id in self._running_cpu)
-        stalled = sum(
+        now_text = now.strftime("%H:%M:%S")
+        running_cpu = self._running_cpu
+        live = stalled = 0
+        for s in self._sessions:
+            if s.id in running_cpu:
+                live += 1
+            elif s.pending > 0 or s.in_progress > 0:
+                stalled += 1
+        total_cpu = self._total_cpu
+        ci_fails = sum(
             1
-            for s in self._sessions
-            if (s.pending > 0 or s.in_progress > 0) and s.id not in self._running_cpu
+            for p in (self._snapshot.prs if self._snapshot else [])
+            if p.ci_status == CI_FAIL
         )
-        total_cpu = sum(
-            p.cpu_percent
-            for p in (self._snapshot.running_processes if self._snapshot else [])
+        flashing = bool(self._error_flash_until and now < self._error_flash_until)
+        if not flashing:
+            self._error_flash_until = None
+
+        # Skip the Static update (and its re-layout) when nothing visible changed
+        key = (
+            spinner,
+            now_text,
+            live,
+            stalled,
+            int(round(total_cpu)) if total_cpu >= 1 else 0,
+            int(round(self._total_cost)) if self._total_cost >= 1 else 0,
+            self._current_branch,
+            ci_fails,
+            flashing,
         )
+        if key == self._last_topbar_key:
+            return
+        self._last_topbar_key = key
+
         parts = [
             " %s %s OC//DASH" % (spinner, _TERM),
             "%s %s" % (_SEP, now_text),
@@ -1272,24 +1403,21 @@ class OCDashboardApp(App[None]):
                 "%s %s $%s" % (_SEP, _DOLLAR, "{:,.0f}".format(self._total_cost))
             )
         if self._current_branch:
-            branch_display = self._current_branch
-            if len(branch_display) > 28:
-                branch_display = branch_display[:25] + "..."
+            if self._branch_display[0] != self._current_branch:
+                self._branch_display = (
+                    self._current_branch,
+                    _truncate(self._current_branch, 28),
+                )
+            branch_display = self._branch_display[1]
             parts.append("%s %s %s" % (_SEP, _BRANCH_ICON, branch_display))
-        ci_fails = sum(
-            1
-            for p in (self._snapshot.prs if self._snapshot else [])
-            if p.ci_status == CI_FAIL
-        )
         if ci_fails > 0:
             parts.append("%s [bold red]%s %s CI FAIL[/]" % (_SEP, _TIMES, ci_fails))
 
         topbar = self.query_one("#topbar", Static)
-        if self._error_flash_until and datetime.now() < self._error_flash_until:
+        if flashing:
             topbar.add_class("error-flash")
         else:
             topbar.remove_class("error-flash")
-            self._error_flash_until = None
         topbar.update("  ".join(parts))
 
     def _render_footerbar(self) -> None:
@@ -1317,6 +1445,15 @@ class OCDashboardApp(App[None]):
     def _render_detail(self) -> None:
         detail = self.query_one("#detail-body", Static)
         project = self._selected_project()
+        state = self._dashboard.state
+        key = (
+            project.id if project else None,
+            state.snapshot_version,
+            state.kanban_version,
+        )
+        if key == self._detail_key:
+            return
+        self._detail_key = key
         if not project:
             detail.update(" [dim]No project selected. Press 'a' to create one.[/]")
             return
@@ -1339,12 +1476,9 @@ class OCDashboardApp(App[None]):
 
         if project.session_ids:
             sess_parts = []
+            short_titles = self._dashboard.state.session_short_titles
             for sid in project.session_ids[:5]:
-                title = sid[:12]
-                for s in self._sessions:
-                    if s.id == sid:
-                        title = s.title[:20]
-                        break
+                title = short_titles.get(sid, sid[:12])
                 sess_parts.append("[cyan]%s[/]" % title)
             sess_line = " %s Sessions: %s" % (_TERM, "  ".join(sess_parts))
             if len(project.session_ids) > 5:
@@ -1374,8 +1508,11 @@ class OCDashboardApp(App[None]):
 
     # ── Helpers ────────────────────────────────────────────────────────
 
+    @work(thread=True, exclusive=True, group="init_branch")
     def _init_branch(self) -> None:
+        # git can take seconds on a cold or slow repo; keep it off the UI thread
         self._dashboard.init_branch()
+        self.call_from_thread(self._render_topbar)
 
 
 def main() -> None:
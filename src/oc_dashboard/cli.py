@@ -23,29 +23,51 @@ import argparse
 import os
 import subprocess
 import sys
-
-from .kanban import ALL_STAGES, STAGES, STAGE_LABELS, LocalJsonKanban
+from typing import Optional
+
+from .kanban import (
+    ALL_STAGE_SET,
+    ALL_STAGES,
+    STAGE_LABELS,
+    STAGE_SET,
+    STAGES,
+    KanbanProject,
+    LocalJsonKanban,
+)
 from .opencode import opencode_env_prefix
 
+_adapter_instance = None  # type: Optional[LocalJsonKanban]
+
 
 def _adapter():
     # type: () -> LocalJsonKanban
-    return LocalJsonKanban()
+    """Return the process-wide Kanban adapter, creating it on first use."""
+    global _adapter_instance
+    if _adapter_instance is None:
+        _adapter_instance = LocalJsonKanban()
+    return _adapter_instance
 
 
-def _print_project(p, verbose=False):
-    """Print a single project in agent-friendly format."""
-    print("id=%s  stage=%s  title=%s" % (p.id, p.stage, p.title))
+def _format_project(p, verbose=False):
+    # type: (KanbanProject, bool) -> str
+    """Format a single project in agent-friendly form (no trailing newline)."""
+    lines = ["id=%s  stage=%s  title=%s" % (p.id, p.stage, p.title)]
     if verbose:
         if p.description:
-            print("  desc=%s" % p.description)
+            lines.append("  desc=%s" % p.description)
         if p.session_ids:
-            print("  sessions=%s" % ",".join(p.session_ids))
+            lines.append("  sessions=%s" % ",".join(p.session_ids))
         if p.pr_numbers:
-            print("  prs=%s" % ",".join(str(n) for n in p.pr_numbers))
+            lines.append("  prs=%s" % ",".join(str(n) for n in p.pr_numbers))
         if p.tags:
-            print("  tags=%s" % ",".join(p.tags))
-        print("  created=%s  updated=%s" % (p.created_at, p.updated_at))
+            lines.append("  tags=%s" % ",".join(p.tags))
+        lines.append("  created=%s  updated=%s" % (p.created_at, p.updated_at))
+    return "\n".join(lines)
+
+
+def _print_project(p, verbose=False):
+    """Print a single project in agent-friendly format."""
+    print(_format_project(p, verbose))
 
 
 def cmd_list(args):
@@ -56,8 +78,7 @@ def cmd_list(args):
     if not projects:
         print("No projects found.")
         return
-    for p in projects:
-        _print_project(p)
+    sys.stdout.write("\n".join(_format_project(p) for p in projects) + "\n")
 
 
 def cmd_show(args):
@@ -71,7 +92,7 @@ def cmd_show(args):
 
 def cmd_create(args):
     adapter = _adapter()
-    stage = args.stage if args.stage and args.stage in STAGES else "pending"
+    stage = args.stage if args.stage and args.stage in STAGE_SET else "pending"
     tags = args.tag if args.tag else []
     p = adapter.create_project(
         title=args.title,
@@ -84,7 +105,7 @@ def cmd_create(args):
 
 
 def cmd_move(args):
-    if args.stage not in ALL_STAGES:
+    if args.stage not in ALL_STAGE_SET:
         print("Invalid stage: %s. Valid: %s" % (args.stage, ", ".join(ALL_STAGES)))
         sys.exit(1)
     adapter = _adapter()
@@ -145,7 +166,7 @@ def cmd_restore(args):
         print("Project not found: %s" % args.id)
         sys.exit(1)
     stage = args.stage or p.previous_stage or "done"
-    if stage not in STAGES:
+    if stage not in STAGE_SET:
         stage = "done"
     adapter.update_project(args.id, previous_stage=None)
     p = adapter.move_project(args.id, stage)
@@ -196,7 +217,7 @@ def cmd_unlink_pr(args):
 def cmd_stages(_args):
     for s in ALL_STAGES:
         label = STAGE_LABELS.get(s, s)
-        board = " (board)" if s in STAGES else ""
+        board = " (board)" if s in STAGE_SET else ""
         print("%s  %s%s" % (s, label, board))
 
 
@@ -286,127 +307,137 @@ def cmd_wheel_go(args):
         print(">> %s  %s  session=%s" % (p.id, p.title, session_id))
         return
 
+    # respawn-pane -k may kill this pane (and us) before atexit could run
+    adapter.flush()
     env_prefix = opencode_env_prefix()
     oc_cmd = "%sopencode -s %s" % (env_prefix, session_id)
     subprocess.Popen(
         ["tmux", "respawn-pane", "-k", oc_cmd],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
+        close_fds=False,
+        start_new_session=True,
     )
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="oc-kanban",
-        description="Kanban board CLI for oc-dashboard",
-    )
-    sub = parser.add_subparsers(dest="command")
+def _args_list(p):
+    p.add_argument("--stage", choices=ALL_STAGES, help="Filter by stage")
+
+
+def _args_id(p):
+    p.add_argument("id", help="Project ID")
 
-    # list
-    p_list = sub.add_parser("list", help="List projects")
-    p_list.add_argument("--stage", choices=ALL_STAGES, help="Filter by stage")
-
-    # show
-    p_show = sub.add_parser("show", help="Show project details")
-    p_show.add_argument("id", help="Project ID")
-
-    # create
-    p_create = sub.add_parser("create", help="Create a project")
-    p_create.add_argument("title", help="Project title")
-    p_create.add_argument("--desc", default="", help="Description")
-    p_create.add_argument("--stage", choices=STAGES, default="pending")
-    p_create.add_argument("--tag", action="append", help="Tag (repeatable)")
-
-    # move
-    p_move = sub.add_parser("move", help="Move project to a stage")
-    p_move.add_argument("id", help="Project ID")
-    p_move.add_argument("stage", choices=ALL_STAGES, help="Target stage")
-
-    # update
-    p_update = sub.add_parser("update", help="Update project fields")
-    p_update.add_argument("id", help="Project ID")
-    p_update.add_argument("--title", help="New title")
-    p_update.add_argument("--desc", help="New description")
-    p_update.add_argument("--stage", choices=ALL_STAGES, help="New stage")
-
-    # delete
-    p_delete = sub.add_parser("delete", help="Delete a project permanently")
-    p_delete.add_argument("id", help="Project ID")
-
-    # archive
-    p_archive = sub.add_parser("archive", help="Archive a project")
-    p_archive.add_argument("id", help="Project ID")
-
-    # restore
-    p_restore = sub.add_parser("restore", help="Restore an archived project")
-    p_restore.add_argument("id", help="Project ID")
-    p_restore.add_argument(
+
+def _args_create(p):
+    p.add_argument("title", help="Project title")
+    p.add_argument("--desc", default="", help="Description")
+    p.add_argument("--stage", choices=STAGES, default="pending")
+    p.add_argument("--tag", action="append", help="Tag (repeatable)")
+
+
+def _args_move(p):
+    p.add_argument("id", help="Project ID")
+    p.add_argument("stage", choices=ALL_STAGES, help="Target stage")
+
+
+def _args_update(p):
+    p.add_argument("id", help="Project ID")
+    p.add_argument("--title", help="New title")
+    p.add_argument("--desc", help="New description")
+    p.add_argument("--stage", choices=ALL_STAGES, help="New stage")
+
+
+def _args_restore(p):
+    p.add_argument("id", help="Project ID")
+    p.add_argument(
         "--stage",
         choices=STAGES,
         default=None,
         help="Restore to stage (default: previous stage)",
     )
 
-    # link-session
-    p_ls = sub.add_parser("link-session", help="Link session to project")
-    p_ls.add_argument("id", help="Project ID")
-    p_ls.add_argument("session_id", help="OpenCode session ID")
-
-    # unlink-session
-    p_us = sub.add_parser("unlink-session", help="Unlink session from project")
-    p_us.add_argument("id", help="Project ID")
-    p_us.add_argument("session_id", help="OpenCode session ID")
-
-    # link-pr
-    p_lp = sub.add_parser("link-pr", help="Link PR to project")
-    p_lp.add_argument("id", help="Project ID")
-    p_lp.add_argument("pr_number", type=int, help="PR number")
-
-    # unlink-pr
-    p_up = sub.add_parser("unlink-pr", help="Unlink PR from project")
-    p_up.add_argument("id", help="Project ID")
-    p_up.add_argument("pr_number", type=int, help="PR number")
-
-    # stages
-    sub.add_parser("stages", help="List valid stages")
-
-    # wheel
-    sub.add_parser("wheel", help="List wheel contents")
-    p_wa = sub.add_parser("wheel-add", help="Add project to wheel")
-    p_wa.add_argument("id", help="Project ID")
-    p_wr = sub.add_parser("wheel-remove", help="Remove project from wheel")
-    p_wr.add_argument("id", help="Project ID")
-    sub.add_parser("wheel-next", help="Advance wheel cursor")
-    sub.add_parser("wheel-prev", help="Move wheel cursor back")
-    p_wg = sub.add_parser("wheel-go", help="Rotate wheel and open session in tmux")
-    p_wg.add_argument("direction", choices=["next", "prev"], help="Rotation direction")
 
+def _args_session(p):
+    p.add_argument("id", help="Project ID")
+    p.add_argument("session_id", help="OpenCode session ID")
+
+
+def _args_pr(p):
+    p.add_argument("id", help="Project ID")
+    p.add_argument("pr_number", type=int, help="PR number")
+
+
+def _args_wheel_go(p):
+    p.add_argument("direction", choices=["next", "prev"], help="Rotation direction")
+
+
+# command -> (help, argument builder, handler)
+_COMMANDS = {
+    "list": ("List projects", _args_list, cmd_list),
+    "show": ("Show project details", _args_id, cmd_show),
+    "create": ("Create a project", _args_create, cmd_create),
+    "move": ("Move project to a stage", _args_move, cmd_move),
+    "update": ("Update project fields", _args_update, cmd_update),
+    "delete": ("Delete a project permanently", _args_id, cmd_delete),
+    "archive": ("Archive a project", _args_id, cmd_archive),
+    "restore": ("Restore an archived project", _args_restore, cmd_restore),
+    "link-session": ("Link session to project", _args_session, cmd_link_session),
+    "unlink-session": (
+        "Unlink session from project",
+        _args_session,
+        cmd_unlink_session,
+    ),
+    "link-pr": ("Link PR to project", _args_pr, cmd_link_pr),
+    "unlink-pr": ("Unlink PR from project", _args_pr, cmd_unlink_pr),
+    "stages": ("List valid stages", None, cmd_stages),
+    "wheel": ("List wheel contents", None, cmd_wheel),
+    "wheel-add": ("Add project to wheel", _args_id, cmd_wheel_add),
+    "wheel-remove": ("Remove project from wheel", _args_id, cmd_wheel_remove),
+    "wheel-next": ("Advance wheel cursor", None, cmd_wheel_next),
+    "wheel-prev": ("Move wheel cursor back", None, cmd_wheel_prev),
+    "wheel-go": (
+        "Rotate wheel and open session in tmux",
+        _args_wheel_go,
+        cmd_wheel_go,
+    ),
+}
+
+
+def _build_parser(only=None):
+    # type: (Optional[str]) -> argparse.ArgumentParser
+    """Build the CLI parser, limited to the `only` subcommand when given."""
+    parser = argparse.ArgumentParser(
+        prog="oc-kanban",
+        description="Kanban board CLI for oc-dashboard",
+    )
+    sub = parser.add_subparsers(dest="command")
+    for name in [only] if only else _COMMANDS:
+        help_text, add_args, _ = _COMMANDS[name]
+        p = sub.add_parser(name, help=help_text)
+        if add_args is not None:
+            add_args(p)
+    return parser
+
+
+def main():
+    # `stages` takes no arguments and touches no state, so skip argparse
+    if sys.argv[1:] == ["stages"]:
+        cmd_stages(None)
+        return
+    # Only the invoked subcommand needs registering; -h and unknown commands
+    # fall back to the full parser so help output stays complete.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = _build_parser(command if command in _COMMANDS else None)
     args = parser.parse_args()
 
-    dispatch = {
-        "list": cmd_list,
-        "show": cmd_show,
-        "create": cmd_create,
-        "move": cmd_move,
-        "update": cmd_update,
-        "delete": cmd_delete,
-        "archive": cmd_archive,
-        "restore": cmd_restore,
-        "link-session": cmd_link_session,
-        "unlink-session": cmd_unlink_session,
-        "link-pr": cmd_link_pr,
-        "unlink-pr": cmd_unlink_pr,
-        "stages": cmd_stages,
-        "wheel": cmd_wheel,
-        "wheel-add": cmd_wheel_add,
-        "wheel-remove": cmd_wheel_remove,
-        "wheel-next": cmd_wheel_next,
-        "wheel-prev": cmd_wheel_prev,
-        "wheel-go": cmd_wheel_go,
-    }
-
-    if args.command and args.command in dispatch:
-        dispatch[args.command](args)
+    if args.command and args.command in _COMMANDS:
+        try:
+            _COMMANDS[args.command][2](args)
+        finally:
+            # The adapter debounces writes for the TUI; a one-shot command
+            # must not leave them to a timer or the atexit hook
+            if _adapter_instance is not None:
+                _adapter_instance.flush()
     else:
         parser.print_help()
 
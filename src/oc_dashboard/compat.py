@@ -0,0 +1,31 @@
+"""Interpreter and optional-dependency shims shared across the package."""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install oc-dashboard[fast]
+    orjson = None
+
+# Snapshot records and kanban projects are created in bulk and read in the
+# sort/render loops; slots drop the per-instance __dict__ where the
+# interpreter supports it (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_loads(raw):
+    # type: (Any) -> Any
+    """Parse JSON from bytes or str, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(payload):
+    # type: (Any) -> bytes
+    """Compact JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
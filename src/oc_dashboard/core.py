@@ -1,6 +1,7 @@
 import os
 import subprocess
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from .data import (
@@ -15,6 +16,8 @@ from .data import (
 )
 from .kanban import (
     ALL_STAGES,
+    STAGE_INDEX,
+    STAGE_SET,
     STAGES,
     STAGE_LABELS,
     KanbanAdapter,
@@ -22,22 +25,56 @@ from .kanban import (
 )
 from .opencode import OpenCodeClient, opencode_env_prefix
 
+_HEAD_REF_PREFIX = "ref: refs/heads/"
+_UPDATED_AT = attrgetter("updated_at")
+
+
+def _read_git_head(project_path):
+    # type: (str) -> Optional[str]
+    """Read the checked-out branch straight from .git/HEAD.
+
+    Follows the ``gitdir:`` pointer that worktrees and submodules use.
+    Returns "" for a detached HEAD and None when HEAD can't be read, so the
+    caller can fall back to asking git.
+    """
+    git_path = os.path.join(project_path, ".git")
+    try:
+        if os.path.isfile(git_path):
+            with open(git_path, "r") as fh:
+                pointer = fh.read().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = pointer[len("gitdir:") :].strip()
+            git_path = os.path.join(project_path, git_dir)
+        with open(os.path.join(git_path, "HEAD"), "r") as fh:
+            head = fh.read().strip()
+    except OSError:
+        return None
+    if head.startswith(_HEAD_REF_PREFIX):
+        return head[len(_HEAD_REF_PREFIX) :]
+    return ""
+
 
 @dataclass
 class DashboardState:
     snapshot: Optional[DashboardSnapshot] = None
     sessions: List[SessionSummary] = field(default_factory=list)
+    session_short_titles: Dict[str, str] = field(default_factory=dict)
     todos_by_session: Dict[str, List[TodoItem]] = field(default_factory=dict)
     workers_by_session: Dict[str, List[BackgroundWorker]] = field(default_factory=dict)
     running_cpu: Dict[str, float] = field(default_factory=dict)
     cost_by_session: Dict[str, float] = field(default_factory=dict)
     mem_by_session: Dict[str, int] = field(default_factory=dict)
     unattributed_cpu: float = 0.0
+    total_cpu: float = 0.0
     total_cost: float = 0.0
     current_branch: str = ""
     projects_by_stage: Dict[str, List[KanbanProject]] = field(default_factory=dict)
     prev_ci_fail_count: int = 0
     project_path: Optional[str] = None
+    # Bumped on every snapshot / kanban reload so views can skip re-rendering
+    snapshot_version: int = 0
+    kanban_version: int = 0
 
 
 @dataclass
@@ -89,15 +126,21 @@ class Dashboard:
         # type: (DashboardSnapshot) -> None
         s = self.state
         s.snapshot = snapshot
+        s.snapshot_version += 1
         s.sessions = snapshot.sessions
+        s.session_short_titles = {
+            session.id: session.title[:20] for session in snapshot.sessions
+        }
         s.todos_by_session = snapshot.todos_by_session
         s.workers_by_session = snapshot.workers_by_session
         s.project_path = snapshot.project_path
 
         s.running_cpu = {}
         s.unattributed_cpu = 0.0
+        s.total_cpu = 0.0
         s.mem_by_session = {}
         for proc in snapshot.running_processes:
+            s.total_cpu += proc.cpu_percent
             if proc.session_id:
                 s.running_cpu[proc.session_id] = max(
                     s.running_cpu.get(proc.session_id, 0.0), proc.cpu_percent
@@ -123,12 +166,15 @@ class Dashboard:
         for stage in STAGES:
             by_stage[stage] = []
         for p in projects:
-            if p.stage not in STAGES:
+            if p.stage not in STAGE_SET:
                 continue
             by_stage[p.stage].append(p)
         for stage in STAGES:
-            by_stage[stage].sort(key=lambda proj: proj.updated_at, reverse=True)
+            items = by_stage[stage]
+            if len(items) > 1:
+                items.sort(key=_UPDATED_AT, reverse=True)
         self.state.projects_by_stage = by_stage
+        self.state.kanban_version += 1
         return by_stage
 
     # ── Session lifecycle ─────────────────────────────────
@@ -178,7 +224,7 @@ class Dashboard:
         project = self._kanban.get_project(project_id)
         if not project:
             return False
-        idx = STAGES.index(project.stage) if project.stage in STAGES else 0
+        idx = STAGE_INDEX.get(project.stage, 0)
         if direction == "right" and idx < len(STAGES) - 1:
             self._kanban.move_project(project_id, STAGES[idx + 1])
             return True
@@ -242,7 +288,7 @@ class Dashboard:
         if not project:
             return False
         target = stage or project.previous_stage or "done"
-        if target not in STAGES:
+        if target not in STAGE_SET:
             target = "done"
         self._kanban.update_project(project_id, previous_stage=None)
         result = self._kanban.move_project(project_id, target)
@@ -252,7 +298,7 @@ class Dashboard:
         # type: () -> List[KanbanProject]
         projects = self._kanban.list_projects()
         archived = [p for p in projects if p.stage == "archived"]
-        archived.sort(key=lambda p: p.updated_at, reverse=True)
+        archived.sort(key=_UPDATED_AT, reverse=True)
         return archived
 
     # ── Wheel operations ────────────────────────────────
@@ -396,9 +442,7 @@ class Dashboard:
 
     def total_cpu(self):
         # type: () -> float
-        if not self.state.snapshot:
-            return 0.0
-        return sum(p.cpu_percent for p in self.state.snapshot.running_processes)
+        return self.state.total_cpu
 
     def ci_fail_count(self):
         # type: () -> int
@@ -417,20 +461,22 @@ class Dashboard:
             project_path = discover_project_path()
         if not project_path:
             return
-        try:
-            result = subprocess.run(
-                ["git", "-C", project_path, "rev-parse", "--abbrev-ref", "HEAD"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=3,
-            )
-            if result.returncode == 0:
-                branch = result.stdout.strip()
-                if branch and branch != "HEAD":
-                    self.state.current_branch = branch
-        except Exception:
-            pass
+        branch = _read_git_head(project_path)
+        if branch is None:
+            try:
+                result = subprocess.run(
+                    ["git", "-C", project_path, "rev-parse", "--abbrev-ref", "HEAD"],
+                    check=False,
+                    capture_output=True,
+                    timeout=3,
+                )
+            except Exception:
+                return
+            if result.returncode != 0:
+                return
+            branch = result.stdout.decode("utf-8", "replace").strip()
+        if branch and branch != "HEAD":
+            self.state.current_branch = branch
 
     # ── Watchdog ──────────────────────────────────────────
 
@@ -482,6 +528,8 @@ def _launch_session_interactive(session_id=None, project_path=None):
                 ["tmux", "split-window", "-h", "-l", "50%", oc_cmd],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True,
             )
         except Exception:
             pass
@@ -494,6 +542,8 @@ def _launch_session_interactive(session_id=None, project_path=None):
                 ["osascript", "-e", apple_script],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True,
             )
         except Exception:
             pass
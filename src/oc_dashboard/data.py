@@ -1,18 +1,25 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import json
 import glob as globmod
 import os
 import re
 import sqlite3
 import subprocess
-from typing import Any, List, Optional, Tuple
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.request import pathname2url
 
+from .compat import DATACLASS_SLOTS, json_loads
 
 DB_PATH = os.path.expanduser("~/.local/share/opencode/opencode.db")
 WAL_PATH = DB_PATH + "-wal"
 LOG_DIR = os.path.expanduser("~/.local/share/opencode/log")
 
+_SNAPSHOT_WORKERS = 8
+
 # Nerd Font icons (Private Use Area) - requires Nerd Font patched terminal font
 NF_CHECK = chr(0xF00C)  # nf-fa-check
 NF_TIMES = chr(0xF00D)  # nf-fa-times
@@ -29,8 +36,16 @@ CI_PASS = NF_CHECK
 CI_FAIL = NF_TIMES
 CI_PENDING = NF_SPINNER
 
+REVIEW_STATUS_LABELS = {
+    "APPROVED": NF_CHECK + " Approved",
+    "CHANGES_REQUESTED": NF_TIMES + " Changes",
+    "REVIEW_REQUIRED": NF_EYE + " Needs review",
+}
+REVIEW_STATUS_DEFAULT = NF_SPINNER + " Pending"
+_NEEDS_REVIEW = REVIEW_STATUS_LABELS["REVIEW_REQUIRED"]
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SessionSummary:
     id: str
     title: str
@@ -49,13 +64,13 @@ class SessionSummary:
         return self.pending + self.in_progress + self.completed + self.cancelled
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TodoItem:
     status: str
     content: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunningProcess:
     pid: int
     cpu_percent: float
@@ -64,14 +79,14 @@ class RunningProcess:
     session_id: Optional[str]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WorktreeStatus:
     path: str
     branch: str
     dirty: bool
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BackgroundWorker:
     id: str
     parent_id: str
@@ -82,7 +97,7 @@ class BackgroundWorker:
     message_count: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PullRequestSummary:
     number: int
     title: str
@@ -94,7 +109,7 @@ class PullRequestSummary:
     url: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Recommendation:
     priority: str  # critical, high, medium, low
     icon: str
@@ -102,7 +117,7 @@ class Recommendation:
     action: Optional[str]  # "pr:37410" or "session:ses_xxx" or None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SessionCost:
     session_id: str
     title: str
@@ -115,20 +130,19 @@ class SessionCost:
         return self.direct_cost + self.child_cost
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DailySpend:
     day: str
     total_cost: float
 
 
-@dataclass
-class LogEvent:
+class LogEvent(NamedTuple):
     time_str: str
     event_type: str
     fields: dict  # type: dict
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DashboardSnapshot:
     sessions: List[SessionSummary]
     todos_by_session: dict
@@ -143,20 +157,123 @@ class DashboardSnapshot:
     errors: List[str]
 
 
+# ── Connection pool ───────────────────────────────────────────────
+#
+# Each refresh runs half a dozen queries, usually from a fresh worker thread.
+# Idle connections are parked here and handed out again instead of reopening
+# the DB (and re-reading the WAL index) for every query. Connections are
+# retired every _POOL_ROTATE_CYCLES snapshots so none lives forever.
+#
+# The dashboard is a read-only client of OpenCode's DB: pooled connections
+# open it with mode=ro plus query_only, and serve pages through mmap.
+
+
+class _PooledConnection(sqlite3.Connection):
+    generation = 0  # pool generation this connection was opened under
+
+
+_POOL_SIZE = 6
+_POOL_ROTATE_CYCLES = 100
+
+_pool_lock = threading.Lock()
+_idle_connections = []  # type: List[_PooledConnection]
+_pool_generation = 0
+_pool_cycles = 0
+
+_READ_PRAGMAS = (
+    "PRAGMA query_only = 1;",
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB
+    "PRAGMA cache_size = -8192;",  # 8 MiB per pooled connection
+    "PRAGMA temp_store = MEMORY;",
+)
+
+_DB_EXISTS_TTL = 1.0
+_db_exists_cache = (None, 0.0, False)  # type: Tuple[Optional[str], float, bool]
+
+
+def _db_exists(max_age=_DB_EXISTS_TTL):
+    # type: (float) -> bool
+    """os.path.exists(DB_PATH), reusing a result up to max_age seconds old."""
+    global _db_exists_cache
+    path, checked_at, exists = _db_exists_cache
+    now = time.monotonic()
+    if path != DB_PATH or now - checked_at >= max_age:
+        exists = os.path.exists(DB_PATH)
+        _db_exists_cache = (DB_PATH, now, exists)
+    return exists
+
+
 def _connect() -> sqlite3.Connection:
-    connection = sqlite3.connect(DB_PATH)
+    with _pool_lock:
+        while _idle_connections:
+            connection = _idle_connections.pop()
+            if connection.generation == _pool_generation:
+                return connection
+            connection.close()
+        generation = _pool_generation
+    connection = _PooledConnection(
+        "file:%s?mode=ro" % pathname2url(os.path.abspath(DB_PATH)),
+        uri=True,
+        check_same_thread=False,
+    )
+    for pragma in _READ_PRAGMAS:
+        connection.execute(pragma)
     connection.row_factory = sqlite3.Row
+    connection.generation = generation
     return connection
 
 
-def _parse_db_datetime(value):
-    # type: (str) -> datetime
-    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+def _release(connection):
+    # type: (sqlite3.Connection) -> None
+    """Return a connection from _connect() to the pool (or close it)."""
+    with _pool_lock:
+        if (
+            isinstance(connection, _PooledConnection)
+            and connection.generation == _pool_generation
+            and len(_idle_connections) < _POOL_SIZE
+        ):
+            _idle_connections.append(connection)
+            return
+    connection.close()
+
+
+def _reset_pool():
+    # type: () -> None
+    """Close all idle connections; ones still checked out close on release."""
+    global _pool_generation, _pool_cycles
+    with _pool_lock:
+        _pool_generation += 1
+        _pool_cycles = 0
+        idle = list(_idle_connections)
+        del _idle_connections[:]
+    for connection in idle:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def _tick_pool():
+    # type: () -> None
+    global _pool_cycles
+    with _pool_lock:
+        _pool_cycles += 1
+        rotate = _pool_cycles >= _POOL_ROTATE_CYCLES
+    if rotate:
+        _reset_pool()
+
+
+def _epoch_datetime(seconds):
+    # type: (Optional[int]) -> datetime
+    """Local datetime for a DB epoch-seconds value; now() when missing."""
+    if seconds is None:
+        return datetime.now()
+    return datetime.fromtimestamp(seconds)
 
 
 def discover_project_path():
     # type: () -> Optional[str]
-    if not os.path.exists(DB_PATH):
+    if not _db_exists():
         return None
 
     query = (
@@ -171,7 +288,7 @@ def discover_project_path():
         try:
             row = connection.execute(query).fetchone()
         finally:
-            connection.close()
+            _release(connection)
         if not row:
             return None
         worktree = row["worktree"]
@@ -180,6 +297,120 @@ def discover_project_path():
         return None
 
 
+# Characters Python's \s matches, for trimming the gap before "(fork #N)"
+_SQL_WHITESPACE = (
+    "char(9, 10, 11, 12, 13, 28, 29, 30, 31, 32, 133, 160, 5760, 8192, 8193, "
+    "8194, 8195, 8196, 8197, 8198, 8199, 8200, 8201, 8202, 8232, 8233, 8239, "
+    "8287, 12288)"
+)
+
+# Root sessions grouped into repo blocks and fork families, already in display
+# order. A title "X (fork #N)" is a fork of the most recent original titled X
+# in the same directory; forks without one are shown as standalone sessions.
+# Recency compares whole seconds, as the displayed timestamps do.
+_SESSIONS_QUERY = """
+WITH
+-- The newest root sessions, numbered by recency
+roots AS (
+  SELECT s.id, s.parent_id,
+    COALESCE(NULLIF(s.title, ''), '(untitled)') as title,
+    COALESCE(s.directory, '') as directory,
+    s.time_updated / 1000 as updated_s,
+    ROW_NUMBER() OVER (ORDER BY s.time_updated DESC) as rn
+  FROM session s
+  WHERE s.time_archived IS NULL
+    AND s.parent_id IS NULL
+  ORDER BY rn
+  LIMIT ?
+),
+-- Like a regex '$', the suffix may be followed by one trailing newline
+matched AS (
+  SELECT *, CASE WHEN substr(title, -1) = char(10)
+    THEN substr(title, 1, length(title) - 1) ELSE title END as mt
+  FROM roots
+),
+-- stem is the title minus the 'N)' of a '(fork #N)' suffix
+stems AS (
+  SELECT *, rtrim(mt, '0123456789)') as stem FROM matched
+),
+suffixed AS (
+  SELECT *,
+    stem GLOB '?*(fork #'
+      AND substr(mt, length(stem) + 1) GLOB '[0-9]*)'
+      AND substr(mt, length(stem) + 1, length(mt) - length(stem) - 1)
+        NOT GLOB '*[^0-9]*' as has_suffix,
+    substr(stem, 1, length(stem) - 7) as prefix
+  FROM stems
+),
+-- base is the title before the suffix, minus the whitespace gap
+parsed AS (
+  SELECT id, parent_id, title, directory, updated_s, rn,
+    CASE WHEN rtrim(prefix, %(ws)s) = ''
+      THEN substr(prefix, 1, 1)
+      ELSE rtrim(prefix, %(ws)s) END as base,
+    has_suffix
+  FROM suffixed
+),
+forks AS (
+  SELECT id, parent_id, title, directory, updated_s, rn,
+    CASE WHEN has_suffix AND instr(base, char(10)) = 0
+      THEN base END as base_title
+  FROM parsed
+),
+-- The most recent original for each title in each directory
+first_originals AS (
+  SELECT directory, title, id as family_id FROM (
+    SELECT directory, title, id,
+      ROW_NUMBER() OVER (PARTITION BY directory, title ORDER BY rn) as k
+    FROM forks WHERE base_title IS NULL
+  ) WHERE k = 1
+),
+families AS (
+  SELECT f.*, COALESCE(o.family_id, f.id) as family_id
+  FROM forks f
+  LEFT JOIN first_originals o
+    ON f.base_title IS NOT NULL
+    AND o.directory = f.directory AND o.title = f.base_title
+),
+-- Sort keys for repo blocks, families and forks within a family
+ranked AS (
+  SELECT *,
+    MAX(updated_s) OVER (PARTITION BY directory) as repo_s,
+    MIN(rn) OVER (PARTITION BY directory) as repo_rn,
+    MAX(updated_s) OVER (PARTITION BY directory, family_id) as family_s,
+    MIN(CASE WHEN id = family_id THEN rn END)
+      OVER (PARTITION BY directory, family_id) as head_rn,
+    MAX(CASE WHEN id = family_id AND base_title IS NOT NULL THEN 1 ELSE 0 END)
+      OVER (PARTITION BY directory, family_id) as head_is_fork,
+    MIN(CASE WHEN base_title IS NOT NULL THEN rn END)
+      OVER (PARTITION BY directory, base_title) as base_rn
+  FROM families
+),
+-- Todo counts per status, for the listed sessions only
+todo_counts AS (
+  SELECT session_id,
+    SUM(status = 'pending') as pending,
+    SUM(status = 'in_progress') as in_progress,
+    SUM(status = 'completed') as completed,
+    SUM(status = 'cancelled') as cancelled
+  FROM todo
+  WHERE session_id IN (SELECT id FROM roots)
+  GROUP BY session_id
+)
+SELECT r.id, r.title, r.directory, r.family_id,
+  r.updated_s, r.repo_s,
+  t.pending, t.in_progress, t.completed, t.cancelled
+FROM ranked r
+LEFT JOIN todo_counts t ON t.session_id = r.id
+ORDER BY r.repo_s DESC, r.repo_rn,
+  r.family_s DESC, r.head_is_fork,
+  CASE WHEN r.head_is_fork THEN r.base_rn ELSE r.head_rn END, r.head_rn,
+  r.id != r.family_id,
+  CASE WHEN r.id != r.family_id THEN r.title END,
+  r.rn;
+""" % {"ws": _SQL_WHITESPACE}
+
+
 def fetch_sessions(limit):
     # type: (int) -> List[SessionSummary]
     """Fetch root sessions grouped by repo, with forks nested under originals.
@@ -189,239 +420,202 @@ def fetch_sessions(limit):
         ├─ Session A                    depth=1
         │  └─ Session A (fork #1)       depth=2
         └─ Session B                    depth=1
+
+    Grouping and ordering happen in SQL (_SESSIONS_QUERY); this only
+    inserts the group headers.
     """
-    if not os.path.exists(DB_PATH):
+    if not _db_exists():
         return []
 
-    query = (
-        "SELECT s.id, s.title, s.parent_id, s.directory, "
-        "  datetime(s.time_updated/1000, 'unixepoch') as updated,"
-        "  (SELECT COUNT(*) FROM todo t WHERE t.session_id = s.id AND t.status = 'pending') as pending,"
-        "  (SELECT COUNT(*) FROM todo t WHERE t.session_id = s.id AND t.status = 'in_progress') as in_progress,"
-        "  (SELECT COUNT(*) FROM todo t WHERE t.session_id = s.id AND t.status = 'completed') as completed,"
-        "  (SELECT COUNT(*) FROM todo t WHERE t.session_id = s.id AND t.status = 'cancelled') as cancelled "
-        "FROM session s "
-        "WHERE s.time_archived IS NULL "
-        "  AND s.parent_id IS NULL "
-        "ORDER BY s.time_updated DESC "
-        "LIMIT ?;"
-    )
-
-    _FORK_RE = re.compile(r"^(.+?)\s*\(fork #(\d+)\)$")
-
-    def _row_to_session(row, depth=0):
-        # type: (Any, int) -> SessionSummary
-        try:
-            updated = _parse_db_datetime(str(row["updated"]))
-        except Exception:
-            updated = datetime.now()
-        return SessionSummary(
-            id=str(row["id"]),
-            title=str(row["title"] or "(untitled)"),
-            updated=updated,
-            pending=int(row["pending"] or 0),
-            in_progress=int(row["in_progress"] or 0),
-            completed=int(row["completed"] or 0),
-            cancelled=int(row["cancelled"] or 0),
-            parent_id=str(row["parent_id"]) if row["parent_id"] else None,
-            depth=depth,
-            directory=str(row["directory"] or ""),
-        )
-
     try:
         connection = _connect()
         try:
-            rows = connection.execute(query, (limit,)).fetchall()
+            rows = connection.execute(_SESSIONS_QUERY, (limit,)).fetchall()
         finally:
-            connection.close()
+            _release(connection)
 
-        # Group by directory (repo)
-        groups = {}  # type: dict  # directory -> [rows]
+        sessions = []  # type: List[SessionSummary]
+        current_directory = None  # type: Optional[str]
         for row in rows:
-            d = str(row["directory"] or "")
-            groups.setdefault(d, []).append(row)
-
-        # Build each repo group, then sort groups and sessions by effective recency
-        repo_blocks = []  # type: list  # [(effective_time, header, session_list)]
-        for directory, dir_rows in groups.items():
-            repo_name = os.path.basename(directory) or directory
-
-            # Detect forks: match 'Title (fork #N)' -> group under original 'Title'
-            originals = []  # type: list
-            fork_bucket = {}  # type: dict  # base_title -> [fork_sessions]
-
-            for row in dir_rows:
-                sess = _row_to_session(row, depth=1)
-                m = _FORK_RE.match(sess.title)
-                if m:
-                    base = m.group(1)
-                    fork_bucket.setdefault(base, []).append(sess)
-                else:
-                    originals.append(sess)
-
-            # Build session families: (effective_time, original, [forks])
-            families = []  # type: list
-            for sess in originals:
-                forks = fork_bucket.pop(sess.title, [])
-                # Effective time = max of own time and all fork times
-                effective = sess.updated
-                for f in forks:
-                    if f.updated > effective:
-                        effective = f.updated
-                families.append((effective, sess, forks))
-
-            # Orphan forks (no matching original) become their own family
-            for base_title, forks in fork_bucket.items():
-                for fork in forks:
-                    families.append((fork.updated, fork, []))
-
-            # Sort families by effective time, newest first
-            families.sort(key=lambda fam: fam[0], reverse=True)
-
-            # Repo-level effective time = newest family
-            repo_effective = families[0][0] if families else datetime.now()
-
-            header = SessionSummary(
-                id="group:" + directory,
-                title=repo_name,
-                updated=repo_effective,
-                pending=0,
-                in_progress=0,
-                completed=0,
-                cancelled=0,
-                parent_id=None,
-                depth=0,
-                directory=directory,
-                is_group_header=True,
+            # Interned: shared by every session of a repo, and compared
+            # against the previous row's directory on each iteration
+            directory = sys.intern(str(row["directory"]))
+            if directory != current_directory:
+                current_directory = directory
+                sessions.append(
+                    SessionSummary(
+                        id="group:" + directory,
+                        title=os.path.basename(directory) or directory,
+                        updated=_epoch_datetime(row["repo_s"]),
+                        pending=0,
+                        in_progress=0,
+                        completed=0,
+                        cancelled=0,
+                        parent_id=None,
+                        depth=0,
+                        directory=directory,
+                        is_group_header=True,
+                    )
+                )
+            session_id = str(row["id"])
+            family_id = str(row["family_id"])
+            is_fork = family_id != session_id
+            sessions.append(
+                SessionSummary(
+                    id=session_id,
+                    title=str(row["title"]),
+                    updated=_epoch_datetime(row["updated_s"]),
+                    pending=int(row["pending"] or 0),
+                    in_progress=int(row["in_progress"] or 0),
+                    completed=int(row["completed"] or 0),
+                    cancelled=int(row["cancelled"] or 0),
+                    parent_id=sys.intern(family_id) if is_fork else None,
+                    depth=2 if is_fork else 1,
+                    directory=directory,
+                )
             )
-
-            # Flatten families into ordered session list
-            family_sessions = []  # type: list
-            for effective, sess, forks in families:
-                family_sessions.append(sess)
-                for fork in sorted(forks, key=lambda f: f.title):
-                    fork.depth = 2
-                    fork.parent_id = sess.id
-                    family_sessions.append(fork)
-
-            repo_blocks.append((repo_effective, header, family_sessions))
-
-        # Sort repo groups by effective time, newest first
-        repo_blocks.sort(key=lambda b: b[0], reverse=True)
-
-        # Assemble final flat list
-        sessions = []  # type: list
-        for _, header, family_sessions in repo_blocks:
-            sessions.append(header)
-            sessions.extend(family_sessions)
-
     except Exception:
         return []
     return sessions
 
 
-def fetch_todos_for_session(session_id):
-    # type: (str) -> List[TodoItem]
-    if not os.path.exists(DB_PATH):
-        return []
+def fetch_todos_for_sessions(session_ids):
+    # type: (List[str]) -> Dict[str, List[TodoItem]]
+    """Fetch todos for many sessions in one query, keyed by session id."""
+    todos = {sid: [] for sid in session_ids}  # type: Dict[str, List[TodoItem]]
+    if not session_ids or not _db_exists():
+        return todos
 
-    query = "SELECT t.status, t.content FROM todo t WHERE t.session_id = ?;"
-    items = []
+    query = (
+        "SELECT t.session_id, t.status, t.content FROM todo t "
+        "WHERE t.session_id IN (%s);" % ",".join("?" * len(session_ids))
+    )
     try:
         connection = _connect()
         try:
-            rows = connection.execute(query, (session_id,)).fetchall()
+            rows = connection.execute(query, list(session_ids)).fetchall()
         finally:
-            connection.close()
+            _release(connection)
         for row in rows:
-            items.append(
+            todos[str(row["session_id"])].append(
                 TodoItem(
-                    status=str(row["status"] or "pending"),
+                    status=sys.intern(str(row["status"] or "pending")),
                     content=str(row["content"] or ""),
                 )
             )
     except Exception:
-        return []
-    return items
+        return {sid: [] for sid in session_ids}
+    return todos
+
+
+def fetch_todos_for_session(session_id):
+    # type: (str) -> List[TodoItem]
+    return fetch_todos_for_sessions([session_id])[session_id]
+
+
+_AGENT_TYPE_RE = re.compile(r"\(@(\S+)\s+subagent\)\s*$")
 
 
 def _parse_agent_type(title):
     # type: (str) -> Tuple[str, str]
-    match = re.search(r"\(@(\S+)\s+subagent\)\s*$", title)
+    match = _AGENT_TYPE_RE.search(title)
     if match:
-        agent_type = match.group(1)
+        agent_type = sys.intern(match.group(1))
         description = title[: match.start()].strip()
         return agent_type, description
     return "unknown", title
 
 
-def fetch_workers_for_session(session_id):
-    # type: (str) -> List[BackgroundWorker]
-    if not os.path.exists(DB_PATH):
-        return []
+def fetch_workers_for_sessions(session_ids):
+    # type: (List[str]) -> Dict[str, List[BackgroundWorker]]
+    """Fetch child sessions for many parents in one query, keyed by parent id."""
+    workers = {}  # type: Dict[str, List[BackgroundWorker]]
+    for sid in session_ids:
+        workers[sid] = []
+    if not session_ids or not _db_exists():
+        return workers
 
     query = (
         "SELECT s.id, s.title, s.parent_id, "
-        "  datetime(s.time_created/1000, 'unixepoch') as created, "
-        "  datetime(s.time_updated/1000, 'unixepoch') as updated, "
+        "  s.time_created / 1000 as created_s, "
+        "  s.time_updated / 1000 as updated_s, "
         "  (SELECT COUNT(*) FROM message m WHERE m.session_id = s.id) as msg_count "
         "FROM session s "
-        "WHERE s.parent_id = ? "
-        "ORDER BY s.time_created DESC;"
+        "WHERE s.parent_id IN (%s) "
+        "ORDER BY s.time_created DESC;" % ",".join("?" * len(session_ids))
     )
 
-    workers = []
     try:
         connection = _connect()
         try:
-            rows = connection.execute(query, (session_id,)).fetchall()
+            rows = connection.execute(query, list(session_ids)).fetchall()
         finally:
-            connection.close()
+            _release(connection)
         for row in rows:
-            try:
-                created = _parse_db_datetime(str(row["created"]))
-            except Exception:
-                created = datetime.now()
-            try:
-                updated = _parse_db_datetime(str(row["updated"]))
-            except Exception:
-                updated = datetime.now()
             agent_type, description = _parse_agent_type(str(row["title"] or ""))
-            workers.append(
+            parent_id = sys.intern(str(row["parent_id"]))
+            workers[parent_id].append(
                 BackgroundWorker(
                     id=str(row["id"]),
-                    parent_id=session_id,
+                    parent_id=parent_id,
                     agent_type=agent_type,
                     description=description,
-                    created=created,
-                    updated=updated,
+                    created=_epoch_datetime(row["created_s"]),
+                    updated=_epoch_datetime(row["updated_s"]),
                     message_count=int(row["msg_count"] or 0),
                 )
             )
     except Exception:
-        return []
+        return {sid: [] for sid in session_ids}
     return workers
 
 
+def fetch_workers_for_session(session_id):
+    # type: (str) -> List[BackgroundWorker]
+    return fetch_workers_for_sessions([session_id])[session_id]
+
+
+_PS_SESSION_RE = re.compile(r"(?:-s|--session)\s+(ses_[A-Za-z0-9_\-]+)")
+
+
 def fetch_running_processes():
     # type: () -> List[RunningProcess]
+    # Stream ps output: nearly every line belongs to an unrelated process
+    # and is dropped by the substring check before any tokenizing.
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["ps", "-axo", "pid,pcpu,rss,tty,command"],
-            check=False,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=5,
         )
     except Exception:
         return []
 
-    if result.returncode not in (0, 1):
+    watchdog = threading.Timer(5, proc.kill)
+    watchdog.start()
+    try:
+        entries = _parse_ps_lines(proc.stdout)
+        returncode = proc.wait()
+    except Exception:
+        proc.kill()
+        return []
+    finally:
+        watchdog.cancel()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    if returncode not in (0, 1):
         return []
+    return entries
+
 
+def _parse_ps_lines(lines):
+    # type: (Any) -> List[RunningProcess]
     entries = []
-    session_pattern = re.compile(r"(?:-s|--session)\s+(ses_[A-Za-z0-9_\-]+)")
-    for raw_line in result.stdout.splitlines():
+    for raw_line in lines:
+        if "opencode" not in raw_line:
+            continue
         line = raw_line.strip()
         if not line or line.startswith("PID"):
             continue
@@ -441,7 +635,7 @@ def fetch_running_processes():
         if os.path.basename(argv0) != "opencode":
             continue
 
-        match = session_pattern.search(command_text)
+        match = _PS_SESSION_RE.search(command_text)
         session_id = match.group(1) if match else None
         entries.append(
             RunningProcess(
@@ -455,6 +649,9 @@ def fetch_running_processes():
     return entries
 
 
+_BRANCH_REF_PREFIX = "refs/heads/"
+
+
 def fetch_worktrees(project_path=None):
     # type: (Optional[str]) -> List[WorktreeStatus]
     if not project_path:
@@ -462,7 +659,7 @@ def fetch_worktrees(project_path=None):
 
     try:
         result = subprocess.run(
-            ["git", "-C", project_path, "worktree", "list"],
+            ["git", "-C", project_path, "worktree", "list", "--porcelain"],
             check=False,
             capture_output=True,
             text=True,
@@ -474,35 +671,82 @@ def fetch_worktrees(project_path=None):
     if result.returncode != 0:
         return []
 
-    worktrees = []
-    for line in result.stdout.splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        match = re.match(r"^(\S+)\s+\S+\s+\[(.+)\]$", raw)
-        if not match:
-            continue
-        path = match.group(1)
-        branch = match.group(2)
-        dirty = False
+    # Blank-line separated blocks of "worktree <path>", "HEAD <sha>",
+    # "branch refs/heads/<name>" (or "detached"/"bare"), "prunable ..."
+    listed = []  # type: List[Tuple[str, str]]
+    for block in result.stdout.split("\n\n"):
+        path = branch = ""
+        prunable = False
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "worktree":
+                path = value
+            elif key == "branch":
+                if value.startswith(_BRANCH_REF_PREFIX):
+                    value = value[len(_BRANCH_REF_PREFIX) :]
+                branch = value
+            elif key == "prunable":
+                prunable = True
+        if path and branch and not prunable:
+            listed.append((path, branch))
+
+    dirty_flags = _worktrees_dirty([path for path, _ in listed])
+    return [
+        WorktreeStatus(path=path, branch=branch, dirty=dirty)
+        for (path, branch), dirty in zip(listed, dirty_flags)
+    ]
+
+
+def _worktrees_dirty(paths, timeout=5.0):
+    # type: (List[str], float) -> List[bool]
+    """Check every worktree for tracked changes, running the gits at once.
+
+    All `git diff --quiet HEAD` processes are spawned up front and then
+    reaped in order, so the wall time is the slowest check rather than
+    the sum, without a thread per check. Exit status 1 means dirty; no
+    untracked-file walk, and --no-optional-locks keeps git from
+    rewriting the index.
+    """
+    procs = []  # type: List[Optional[subprocess.Popen]]
+    for path in paths:
         try:
-            status_result = subprocess.run(
-                ["git", "-C", path, "status", "--porcelain"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=5,
+            procs.append(
+                subprocess.Popen(
+                    [
+                        "git",
+                        "--no-optional-locks",
+                        "-C",
+                        path,
+                        "diff",
+                        "--quiet",
+                        "HEAD",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
             )
-            dirty = bool(status_result.stdout.strip())
         except Exception:
-            dirty = False
-        worktrees.append(WorktreeStatus(path=path, branch=branch, dirty=dirty))
-    return worktrees
+            procs.append(None)
+
+    deadline = time.monotonic() + timeout
+    dirty = []  # type: List[bool]
+    for proc in procs:
+        if proc is None:
+            dirty.append(False)
+            continue
+        try:
+            returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception:
+            proc.kill()
+            proc.wait()
+            returncode = None
+        dirty.append(returncode == 1)
+    return dirty
 
 
 def fetch_session_costs(limit=20):
     # type: (int) -> List[SessionCost]
-    if not os.path.exists(DB_PATH):
+    if not _db_exists():
         return []
 
     query = (
@@ -528,7 +772,7 @@ def fetch_session_costs(limit=20):
         try:
             rows = connection.execute(query, (limit,)).fetchall()
         finally:
-            connection.close()
+            _release(connection)
         for row in rows:
             costs.append(
                 SessionCost(
@@ -545,22 +789,26 @@ def fetch_session_costs(limit=20):
 
 def fetch_daily_spend(days=14):
     # type: (int) -> List[DailySpend]
-    if not os.path.exists(DB_PATH):
+    if not _db_exists():
         return []
     if days <= 0:
         return []
 
     start_dt = datetime.now() - timedelta(days=days - 1)
-    start_day = start_dt.strftime("%Y-%m-%d")
+    # Local midnight of the first day, so the window is a plain integer
+    # range on time_created and only in-window rows get DATE()/json work
+    start_ms = int(
+        start_dt.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000
+    )
 
     query = (
         "SELECT "
         "  DATE(m.time_created / 1000, 'unixepoch', 'localtime') as day, "
         "  ROUND(SUM(json_extract(m.data, '$.cost')), 6) as total_cost "
         "FROM message m "
-        "WHERE json_extract(m.data, '$.role') = 'assistant' "
+        "WHERE m.time_created >= ? "
+        "  AND json_extract(m.data, '$.role') = 'assistant' "
         "  AND json_extract(m.data, '$.cost') > 0 "
-        "  AND DATE(m.time_created / 1000, 'unixepoch', 'localtime') >= ? "
         "GROUP BY day "
         "ORDER BY day ASC;"
     )
@@ -569,9 +817,9 @@ def fetch_daily_spend(days=14):
     try:
         connection = _connect()
         try:
-            rows = connection.execute(query, (start_day,)).fetchall()
+            rows = connection.execute(query, (start_ms,)).fetchall()
         finally:
-            connection.close()
+            _release(connection)
         for row in rows:
             day = str(row["day"] or "")
             if not day:
@@ -593,27 +841,97 @@ def fetch_daily_spend(days=14):
     return spends
 
 
+_CI_FAIL_STATES = frozenset(("fail", "failed", "error", "cancelled", "timed_out"))
+_CI_PASS_STATES = frozenset(
+    ("pass", "passed", "success", "completed", "skipping", "skipped")
+)
+
+
 def _compute_ci_status(checks):
     # type: (list) -> str
     if not checks:
         return CI_PENDING
-    states = [str(item.get("state", "")).lower() for item in checks]
-    if any(
-        state in ("fail", "failed", "error", "cancelled", "timed_out")
-        for state in states
-    ):
-        return CI_FAIL
-    if any(
-        state in ("pending", "queued", "in_progress", "waiting", "startup_failure")
-        for state in states
-    ):
-        return CI_PENDING
-    if all(
-        state in ("pass", "passed", "success", "completed", "skipping", "skipped")
-        for state in states
-    ):
-        return CI_PASS
-    return CI_PENDING
+    # Any failure wins outright; otherwise anything that isn't a pass
+    # (pending, queued, unknown, ...) keeps CI pending
+    all_passed = True
+    for item in checks:
+        state = str(item.get("state", "")).lower()
+        if state in _CI_FAIL_STATES:
+            return CI_FAIL
+        if state not in _CI_PASS_STATES:
+            all_passed = False
+    return CI_PASS if all_passed else CI_PENDING
+
+
+# One GraphQL round-trip for every open PR of mine plus its latest check
+# rollup, instead of `gh pr list` followed by a `gh pr checks` per PR.
+# gh fills {owner}/{repo} from the repository in the working directory.
+_PR_SEARCH = "repo:{owner}/{repo} is:pr is:open author:@me"
+_PR_QUERY = """
+query($search: String!) {
+  search(query: $search, type: ISSUE, first: 50) {
+    nodes {
+      ... on PullRequest {
+        number title state headRefName updatedAt url reviewDecision
+        commits(last: 1) {
+          nodes {
+            commit {
+              statusCheckRollup {
+                contexts(first: 100) {
+                  nodes {
+                    __typename
+                    ... on CheckRun { status conclusion }
+                    ... on StatusContext { state }
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL check conclusions / status states -> the `gh pr checks` buckets
+# that _compute_ci_status classifies
+_CHECK_BUCKETS = {
+    "SUCCESS": "pass",
+    "NEUTRAL": "skipping",
+    "SKIPPED": "skipping",
+    "FAILURE": "fail",
+    "ERROR": "fail",
+    "TIMED_OUT": "fail",
+    "ACTION_REQUIRED": "fail",
+    "STARTUP_FAILURE": "fail",
+    "CANCELLED": "cancelled",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+}
+
+
+def _rollup_checks(pr):
+    # type: (Dict[str, Any]) -> List[Dict[str, str]]
+    """Flatten a PR node's latest-commit check rollup into {"state": ...} items."""
+    checks = []  # type: List[Dict[str, str]]
+    for commit_node in (pr.get("commits") or {}).get("nodes") or []:
+        rollup = ((commit_node or {}).get("commit") or {}).get("statusCheckRollup")
+        contexts = ((rollup or {}).get("contexts") or {}).get("nodes") or []
+        for ctx in contexts:
+            if not ctx:
+                continue
+            if ctx.get("__typename") == "CheckRun":
+                if ctx.get("status") != "COMPLETED":
+                    state = "pending"
+                else:
+                    conclusion = str(ctx.get("conclusion") or "")
+                    state = _CHECK_BUCKETS.get(conclusion, conclusion.lower())
+            else:
+                raw = str(ctx.get("state") or "")
+                state = _CHECK_BUCKETS.get(raw, raw.lower())
+            checks.append({"state": state})
+    return checks
 
 
 def fetch_prs(project_path=None):
@@ -622,18 +940,15 @@ def fetch_prs(project_path=None):
         result = subprocess.run(
             [
                 "gh",
-                "pr",
-                "list",
-                "--author",
-                "@me",
-                "--state",
-                "open",
-                "--json",
-                "number,title,state,headRefName,updatedAt,url,reviewDecision",
+                "api",
+                "graphql",
+                "-F",
+                "search=" + _PR_SEARCH,
+                "-f",
+                "query=" + _PR_QUERY,
             ],
             check=False,
             capture_output=True,
-            text=True,
             timeout=8,
             cwd=project_path or None,
         )
@@ -644,39 +959,22 @@ def fetch_prs(project_path=None):
         return []
 
     try:
-        payload = json.loads(result.stdout)
+        payload = json_loads(result.stdout)
+        nodes = payload["data"]["search"]["nodes"]
     except Exception:
         return []
 
     prs = []
-    for item in payload:
+    for item in nodes:
+        if not item:
+            continue
         number = int(item.get("number", 0))
         if not number:
             continue
-        ci_status = CI_PENDING
-        try:
-            checks_result = subprocess.run(
-                ["gh", "pr", "checks", str(number), "--json", "name,state"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=8,
-                cwd=project_path or None,
-            )
-            if checks_result.returncode == 0:
-                checks = json.loads(checks_result.stdout)
-                if isinstance(checks, list):
-                    ci_status = _compute_ci_status(checks)
-        except Exception:
-            ci_status = CI_PENDING
+        ci_status = _compute_ci_status(_rollup_checks(item))
 
         review_raw = str(item.get("reviewDecision", "") or "")
-        review_map = {
-            "APPROVED": NF_CHECK + " Approved",
-            "CHANGES_REQUESTED": NF_TIMES + " Changes",
-            "REVIEW_REQUIRED": NF_EYE + " Needs review",
-        }
-        review_status = review_map.get(review_raw, NF_SPINNER + " Pending")
+        review_status = REVIEW_STATUS_LABELS.get(review_raw, REVIEW_STATUS_DEFAULT)
 
         prs.append(
             PullRequestSummary(
@@ -701,9 +999,6 @@ def relative_time(value):
     if delta < timedelta(hours=1):
         minutes = max(1, int(delta.total_seconds() // 60))
         return "%sm" % minutes
-    if delta < timedelta(hours=1):
-        hours = max(1, int(delta.total_seconds() // 3600))
-        return "%sh" % hours
     if delta < timedelta(days=1):
         hours = max(1, int(delta.total_seconds() // 3600))
         return "%sh" % hours
@@ -727,16 +1022,25 @@ def session_status(session, running_cpu):
 
 def build_recommendations(snapshot):
     # type: (DashboardSnapshot) -> List[Recommendation]
-    recs = []
     running_ids = set()
+    unmapped = 0.0
     for p in snapshot.running_processes:
-        if p.session_id and p.cpu_percent > 1:
+        if not p.session_id:
+            unmapped += p.cpu_percent
+        elif p.cpu_percent > 1:
             running_ids.add(p.session_id)
 
-    # Critical: failing CI
+    # One pass over PRs; each priority keeps its own list so the output
+    # order is unchanged: failing CI, stalled sessions, review, pending CI
+    failing = []  # type: List[Recommendation]
+    review = []  # type: List[Recommendation]
+    ci_running = []  # type: List[Recommendation]
+    pr_branches = set()
     for pr in snapshot.prs:
+        pr_branches.add(pr.head_ref)
         if pr.ci_status == CI_FAIL:
-            recs.append(
+            # Critical: failing CI
+            failing.append(
                 Recommendation(
                     priority="critical",
                     icon=NF_EXCL_CIRCLE,
@@ -744,6 +1048,29 @@ def build_recommendations(snapshot):
                     action="pr:%s" % pr.number,
                 )
             )
+        elif pr.ci_status == CI_PASS:
+            # Medium: PRs with green CI needing review
+            if pr.review_status == _NEEDS_REVIEW:
+                review.append(
+                    Recommendation(
+                        priority="medium",
+                        icon=NF_EYE,
+                        text="Request review on #%s -- CI green" % pr.number,
+                        action="pr:%s" % pr.number,
+                    )
+                )
+        elif pr.ci_status == CI_PENDING:
+            # Medium: PRs with pending CI
+            ci_running.append(
+                Recommendation(
+                    priority="medium",
+                    icon=NF_SPINNER,
+                    text="CI running on #%s: %s" % (pr.number, pr.title[:38]),
+                    action="pr:%s" % pr.number,
+                )
+            )
+
+    recs = failing
 
     # High: stalled sessions with pending work
     for session in snapshot.sessions[:20]:
@@ -758,34 +1085,10 @@ def build_recommendations(snapshot):
                 )
             )
 
-    # Medium: PRs with green CI needing review
-    for pr in snapshot.prs:
-        if pr.ci_status == CI_PASS and "Needs review" in pr.review_status:
-            recs.append(
-                Recommendation(
-                    priority="medium",
-                    icon=NF_EYE,
-                    text="Request review on #%s -- CI green" % pr.number,
-                    action="pr:%s" % pr.number,
-                )
-            )
-
-    # Medium: PRs with pending CI
-    for pr in snapshot.prs:
-        if pr.ci_status == CI_PENDING:
-            recs.append(
-                Recommendation(
-                    priority="medium",
-                    icon=NF_SPINNER,
-                    text="CI running on #%s: %s" % (pr.number, pr.title[:38]),
-                    action="pr:%s" % pr.number,
-                )
-            )
+    recs.extend(review)
+    recs.extend(ci_running)
 
     # Low: high unmapped CPU
-    unmapped = sum(
-        p.cpu_percent for p in snapshot.running_processes if not p.session_id
-    )
     if unmapped > 20:
         recs.append(
             Recommendation(
@@ -797,7 +1100,6 @@ def build_recommendations(snapshot):
         )
 
     # Low: dirty worktrees without PRs
-    pr_branches = set(pr.head_ref for pr in snapshot.prs)
     for wt in snapshot.worktrees:
         if wt.dirty and wt.branch not in pr_branches and wt.branch != "main":
             recs.append(
@@ -812,41 +1114,108 @@ def build_recommendations(snapshot):
     return recs
 
 
+class _DbResults(NamedTuple):
+    sessions: List[SessionSummary]
+    todos_by_session: Dict[str, List[TodoItem]]
+    workers_by_session: Dict[str, List[BackgroundWorker]]
+    session_costs: List[SessionCost]
+    daily_spend: List[DailySpend]
+    project_path: Optional[str]
+
+
+# SQLite-backed results of the last build_snapshot, reused while the DB
+# files are untouched (see _db_cache_key)
+_db_cache_key_value = None  # type: Optional[Tuple[Any, ...]]
+_db_cache = None  # type: Optional[_DbResults]
+
+
+def _db_cache_key(limit):
+    # type: (int) -> Optional[Tuple[Any, ...]]
+    """Key that changes whenever the DB-backed snapshot fields could.
+
+    Every commit touches the WAL and checkpoints touch the main file, so
+    their (mtime, size) pairs cover all writes. The date is included
+    because fetch_daily_spend windows on today.
+    """
+    try:
+        db_stat = os.stat(DB_PATH)
+    except OSError:
+        return None
+    wal = None  # type: Optional[Tuple[int, int]]
+    try:
+        wal_stat = os.stat(WAL_PATH)
+        wal = (wal_stat.st_mtime_ns, wal_stat.st_size)
+    except OSError:
+        pass
+    return (
+        limit,
+        datetime.now().date(),
+        db_stat.st_mtime_ns,
+        db_stat.st_size,
+        wal,
+    )
+
+
+def _fetch_db_results(pool, limit, project_path, key):
+    # type: (ThreadPoolExecutor, int, Optional[str], Optional[Tuple[Any, ...]]) -> _DbResults
+    global _db_cache_key_value, _db_cache
+    costs_future = pool.submit(fetch_session_costs, 20)
+    spend_future = pool.submit(fetch_daily_spend, 14)
+
+    sessions = fetch_sessions(limit)
+    session_ids = [session.id for session in sessions]
+    workers_future = pool.submit(fetch_workers_for_sessions, session_ids)
+    todos_by_session = fetch_todos_for_sessions(session_ids)
+
+    results = _DbResults(
+        sessions=sessions,
+        todos_by_session=todos_by_session,
+        workers_by_session=workers_future.result(),
+        session_costs=costs_future.result(),
+        daily_spend=spend_future.result(),
+        project_path=project_path,
+    )
+    # An empty session list may be a transient read failure; don't pin it
+    if key is not None and sessions:
+        _db_cache_key_value, _db_cache = key, results
+    return results
+
+
 def build_snapshot(limit=30):
     # type: (int) -> DashboardSnapshot
     errors = []
-    if not os.path.exists(DB_PATH):
+    # Fresh check here; the fetchers below reuse it instead of each stat'ing
+    if not _db_exists(max_age=0):
         errors.append("OpenCode DB not found at %s" % DB_PATH)
 
-    sessions = fetch_sessions(limit=limit)
-    todos_by_session = {}
-    for session in sessions:
-        todos_by_session[session.id] = fetch_todos_for_session(session.id)
-
-    workers_by_session = {}
-    for session in sessions:
-        workers_by_session[session.id] = fetch_workers_for_session(session.id)
+    _tick_pool()
+    # The fetchers block on SQLite, ps, git and gh independently; overlap them
+    with ThreadPoolExecutor(max_workers=_SNAPSHOT_WORKERS) as pool:
+        processes_future = pool.submit(fetch_running_processes)
 
-    running_processes = fetch_running_processes()
-    project_path = discover_project_path()
-    if not project_path:
-        errors.append("Could not discover project path from DB")
+        key = _db_cache_key(limit)
+        cached = _db_cache if key is not None and key == _db_cache_key_value else None
+        project_path = cached.project_path if cached else discover_project_path()
+        if not project_path:
+            errors.append("Could not discover project path from DB")
+        worktrees_future = pool.submit(fetch_worktrees, project_path)
+        prs_future = pool.submit(fetch_prs, project_path)
 
-    worktrees = fetch_worktrees(project_path=project_path)
-    prs = fetch_prs(project_path=project_path)
-    session_costs = fetch_session_costs(limit=20)
-    daily_spend = fetch_daily_spend(days=14)
+        db = cached or _fetch_db_results(pool, limit, project_path, key)
+        running_processes = processes_future.result()
+        worktrees = worktrees_future.result()
+        prs = prs_future.result()
 
     snapshot = DashboardSnapshot(
-        sessions=sessions,
-        todos_by_session=todos_by_session,
+        sessions=db.sessions,
+        todos_by_session=db.todos_by_session,
         running_processes=running_processes,
-        workers_by_session=workers_by_session,
+        workers_by_session=db.workers_by_session,
         worktrees=worktrees,
         prs=prs,
         recommendations=[],
-        session_costs=session_costs,
-        daily_spend=daily_spend,
+        session_costs=db.session_costs,
+        daily_spend=db.daily_spend,
         project_path=project_path,
         errors=errors,
     )
@@ -882,23 +1251,46 @@ _LOG_RE = re.compile(
 )
 
 # Events to skip (too noisy)
-SKIP_EVENTS = {
-    "file.watcher.updated",
-    "message.part.delta",
-    "message.part.updated",
-}
+SKIP_EVENTS = frozenset(
+    sys.intern(name)
+    for name in (
+        "file.watcher.updated",
+        "message.part.delta",
+        "message.part.updated",
+    )
+)
 
-SIGNIFICANT_BUS_EVENTS = {
-    "session.error",
-    "session.diff",
-    "session.compacted",
-    "command.executed",
-}
+SIGNIFICANT_BUS_EVENTS = frozenset(
+    sys.intern(name)
+    for name in (
+        "session.error",
+        "session.diff",
+        "session.compacted",
+        "command.executed",
+    )
+)
+
+_VCS_BRANCH_EVENT = sys.intern("vcs.branch")
+
+# Tried in order: a quoted command= wins over a bare one anywhere in the
+# line, and command= wins over cmd=.
+_COMMAND_PATTERNS = (
+    re.compile(r'\bcommand="([^"]+)"'),
+    re.compile(r"\bcommand=(\S+)"),
+    re.compile(r'\bcmd="([^"]+)"'),
+    re.compile(r"\bcmd=(\S+)"),
+)
 
 
 def parse_log_line(line):
     # type: (str) -> Optional[LogEvent]
     """Parse a single log line into a LogEvent, or None if irrelevant."""
+    # Only service=vcs lines and "publishing" service=bus lines can produce
+    # an event; most lines are rejected here without the regex or splitting
+    if "service=vcs" not in line and (
+        "service=bus" not in line or "publishing" not in line
+    ):
+        return None
     m = _LOG_RE.match(line.rstrip())
     if not m:
         return None
@@ -922,7 +1314,7 @@ def parse_log_line(line):
         if from_branch and to_branch:
             return LogEvent(
                 time_str=time_str,
-                event_type="vcs.branch",
+                event_type=_VCS_BRANCH_EVENT,
                 fields={"from": from_branch, "to": to_branch},
             )
         return None
@@ -934,23 +1326,15 @@ def parse_log_line(line):
             return None
         if event_type not in SIGNIFICANT_BUS_EVENTS:
             return None
+        event_type = sys.intern(event_type)
         if event_type == "command.executed":
             command = ""
-            command_match = re.search(r'\bcommand="([^"]+)"', rest)
-            if command_match:
-                command = command_match.group(1)
-            else:
-                command_match = re.search(r"\bcommand=([^\s]+)", rest)
-                if command_match:
-                    command = command_match.group(1)
-            if not command:
-                cmd_match = re.search(r'\bcmd="([^"]+)"', rest)
-                if cmd_match:
-                    command = cmd_match.group(1)
-                else:
-                    cmd_match = re.search(r"\bcmd=([^\s]+)", rest)
-                    if cmd_match:
-                        command = cmd_match.group(1)
+            if "command=" in rest or "cmd=" in rest:
+                for pattern in _COMMAND_PATTERNS:
+                    command_match = pattern.search(rest)
+                    if command_match:
+                        command = command_match.group(1)
+                        break
             if command:
                 fields["command"] = command
         return LogEvent(
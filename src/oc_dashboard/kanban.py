@@ -1,25 +1,36 @@
 """Kanban adapter layer.
 
 Thin abstraction over a Kanban backend.  The *only* concrete implementation
-shipped today is ``LocalJsonKanban`` which stores everything in a single JSON
-file.  The interface is deliberately small so that a JIRA-MCP or Trello-MCP
-adapter can be dropped in later without touching the rest of the dashboard.
+shipped today is ``LocalJsonKanban`` which stores everything in a JSON
+snapshot plus an append-only change log beside it.  The interface is
+deliberately small so that a JIRA-MCP or Trello-MCP adapter can be dropped
+in later without touching the rest of the dashboard.
 
 Stages (ordered): pending -> in_progress -> done
 """
 
-import json
+import atexit
+import fcntl
+import mmap
 import os
+import threading
 import uuid
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from .compat import DATACLASS_SLOTS, json_dumps, json_loads, orjson
 
 # ── Kanban stages (in board order) ────────────────────────
 
 STAGES = ["pending", "in_progress", "done"]
 ALL_STAGES = ["pending", "in_progress", "done", "archived"]
+STAGE_INDEX = {s: i for i, s in enumerate(STAGES)}
+STAGE_SET = frozenset(STAGES)
+ALL_STAGE_SET = frozenset(ALL_STAGES)
 
 STAGE_LABELS = {
     "pending": "Pending",
@@ -32,7 +43,7 @@ STAGE_LABELS = {
 # ── Data models ───────────────────────────────────────────
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class KanbanProject:
     id: str
     title: str
@@ -44,6 +55,18 @@ class KanbanProject:
     pr_numbers: List[int] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     previous_stage: Optional[str] = None
+    # Membership caches for the lists above; kept in step by the adapter
+    session_id_set: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    pr_number_set: Set[int] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # type: () -> None
+        self.session_id_set = set(self.session_ids)
+        self.pr_number_set = set(self.pr_numbers)
 
     def to_dict(self):
         # type: () -> Dict[str, Any]
@@ -89,6 +112,9 @@ class KanbanAdapter(ABC):
     A JIRA or Trello MCP adapter would subclass this.
     """
 
+    # Why the last background save failed, or None; the UI reports it
+    save_error = None  # type: Optional[str]
+
     @abstractmethod
     def list_projects(self):
         # type: () -> List[KanbanProject]
@@ -186,224 +212,525 @@ class KanbanAdapter(ABC):
 # ── Local JSON-file implementation ───────────────────────
 
 _DEFAULT_PATH = os.path.expanduser("~/.local/share/oc-dashboard/kanban.json")
+_SAVE_DEBOUNCE_SECONDS = 0.25
+_SAVE_RETRY_SECONDS = 5.0
+_MMAP_MIN_BYTES = 64 * 1024
+# Fold the append-only log back into the snapshot past this many records
+_LOG_COMPACT_ENTRIES = 500
+
+
+def _read_json_file(path, size):
+    # type: (str, int) -> Any
+    """Parse a JSON file; large ones go to orjson straight from an mmap."""
+    if orjson is None or size < _MMAP_MIN_BYTES:
+        with open(path, "rb") as fh:
+            return json_loads(fh.read())
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _apply_record(rec, projects, wheel):
+    # type: (Dict[str, Any], Dict[str, Any], Dict[str, Any]) -> None
+    op = rec.get("op")
+    if op == "put":
+        d = rec["project"]
+        projects[str(d.get("id", ""))] = d
+    elif op == "delete":
+        projects.pop(rec["id"], None)
+    elif op == "wheel":
+        wheel["ids"] = list(rec.get("ids", []))
+        wheel["cursor"] = int(rec.get("cursor", 0))
 
 
 def _now_iso():
     # type: () -> str
-    return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    return datetime.now().isoformat(timespec="seconds")
+
+
+# Adapters with possibly unflushed changes; weak so the exit hook does not
+# keep every adapter alive.  Short-lived callers (the CLI) should flush()
+# explicitly: atexit does not run when the process dies from a signal.
+_live_adapters = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+@atexit.register
+def _flush_live_adapters():
+    # type: () -> None
+    for adapter in list(_live_adapters):
+        adapter.flush()
 
 
 class LocalJsonKanban(KanbanAdapter):
-    """Dead-simple JSON-file Kanban.  One file, atomic read/write."""
+    """Dead-simple JSON-file Kanban.
+
+    Changes are appended to ``<path>.log`` as full-state records; the
+    snapshot at ``<path>`` is rewritten atomically only on compaction.
+    """
 
     def __init__(self, path=None):
         # type: (Optional[str]) -> None
         self._path = path or _DEFAULT_PATH
-        self._projects = {}  # type: Dict[str, KanbanProject]
+        # Rows stay as raw dicts from disk until first access; _get() swaps
+        # in the KanbanProject in place, keeping file order
+        self._projects = {}  # type: Dict[str, Any]
         self._wheel_ids = []  # type: List[str]
         self._wheel_cursor = 0
+        # Stat keys of the snapshot and log as last loaded or written
+        self._file_key = None  # type: Optional[tuple]
+        # Mutations mark the board dirty and a timer writes it once the
+        # burst settles, retrying if that fails; flush() (also run at exit)
+        # writes immediately and raises on failure
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer = None  # type: Optional[threading.Timer]
+        # Mutations since the last flush; flush appends one full-state
+        # record per touched project to the log instead of rewriting it all
+        self._log_path = self._path + ".log"
+        self._log_entries = 0
+        # Insertion-ordered so new projects replay in creation order
+        self._changed_ids = {}  # type: Dict[str, None]
+        self._deleted_ids = set()  # type: Set[str]
+        self._wheel_changed = False
+        self.save_error = None  # type: Optional[str]
         self._load()
+        _live_adapters.add(self)
 
     # ── persistence ───────────────────────────────────────
 
+    def _get(self, project_id):
+        # type: (str) -> Optional[KanbanProject]
+        p = self._projects.get(project_id)
+        if isinstance(p, dict):
+            p = self._projects[project_id] = KanbanProject.from_dict(p)
+        return p
+
+    def _all_projects(self):
+        # type: () -> List[KanbanProject]
+        return [self._get(pid) for pid in list(self._projects)]
+
+    def _stat_key(self):
+        # type: () -> Optional[tuple]
+        """(inode, mtime_ns, size) of the snapshot and of the log, or None."""
+        keys = []
+        for path in (self._path, self._log_path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                keys.append(None)
+                continue
+            keys.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        if keys == [None, None]:
+            return None
+        return tuple(keys)
+
+    @contextmanager
+    def _file_lock(self, exclusive):
+        # type: (bool) -> Iterator[None]
+        """Inter-process lock: shared to read, exclusive to append or compact."""
+        try:
+            parent = os.path.dirname(self._path)
+            if parent and not os.path.isdir(parent):
+                os.makedirs(parent, exist_ok=True)
+            fh = open(self._path + ".lock", "ab")
+        except OSError:
+            if exclusive:
+                raise
+            # Read-only directory: nobody can write there either, so read
+            # without the lock
+            yield
+            return
+        with fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
     def _load(self):
         # type: () -> None
-        if not os.path.exists(self._path):
-            self._projects = {}
-            self._wheel_ids = []
-            self._wheel_cursor = 0
-            return
-        try:
-            with open(self._path, "r") as fh:
-                data = json.load(fh)
-            projects = data.get("projects", [])
-            self._projects = {}
-            for d in projects:
-                p = KanbanProject.from_dict(d)
-                self._projects[p.id] = p
-            wheel_data = data.get("wheel", {})
-            self._wheel_ids = list(wheel_data.get("ids", []))
-            self._wheel_cursor = int(wheel_data.get("cursor", 0))
-        except Exception:
-            self._projects = {}
-            self._wheel_ids = []
-            self._wheel_cursor = 0
-
-    def _save(self):
+        """Re-read snapshot + log, unless both are unchanged since last time."""
+        with self._lock:
+            if self._stat_key() == self._file_key:
+                return
+            # Shared lock: never see a new snapshot with a stale log or the
+            # old snapshot with a truncated one
+            with self._file_lock(exclusive=False):
+                self._load_locked()
+
+    def _load_locked(self):
         # type: () -> None
+        with self._lock:
+            key = self._stat_key()
+            if key is not None and key == self._file_key:
+                return
+            # Build the new board aside and swap it in at once
+            projects = {}  # type: Dict[str, Any]
+            wheel = {"ids": [], "cursor": 0}  # type: Dict[str, Any]
+            entries = 0
+            if key is not None and key[0] is not None:
+                try:
+                    data = _read_json_file(self._path, key[0][2])
+                    for d in data.get("projects", []):
+                        projects[str(d.get("id", ""))] = d
+                    wheel_data = data.get("wheel", {})
+                    wheel["ids"] = list(wheel_data.get("ids", []))
+                    wheel["cursor"] = int(wheel_data.get("cursor", 0))
+                except Exception:
+                    projects = {}
+                    wheel = {"ids": [], "cursor": 0}
+            if key is not None and key[1] is not None:
+                entries = self._replay_log(projects, wheel)
+            if self._dirty:
+                # Unsaved local changes win over the disk; they are appended
+                # on the next flush
+                for pid in self._changed_ids:
+                    if pid in self._projects:
+                        projects[pid] = self._projects[pid]
+                for pid in self._deleted_ids:
+                    projects.pop(pid, None)
+                if self._wheel_changed:
+                    wheel = {"ids": self._wheel_ids, "cursor": self._wheel_cursor}
+            self._file_key = key
+            self._projects = projects
+            self._wheel_ids = wheel["ids"]
+            self._wheel_cursor = wheel["cursor"]
+            self._log_entries = entries
+
+    def _replay_log(self, projects, wheel):
+        # type: (Dict[str, Any], Dict[str, Any]) -> int
+        """Apply the log's records to projects/wheel; returns the record count."""
+        try:
+            with open(self._log_path, "rb") as fh:
+                lines = fh.read().splitlines()
+        except OSError:
+            return 0
+        entries = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            entries += 1
+            try:
+                _apply_record(json_loads(line), projects, wheel)
+            except Exception:
+                # A torn final line from a crash mid-append; skip it
+                continue
+        return entries
+
+    def _save(self, fsync=False):
+        # type: (bool) -> None
+        """Rewrite the full snapshot.  Only compaction calls this."""
         parent = os.path.dirname(self._path)
         if parent and not os.path.isdir(parent):
             os.makedirs(parent, exist_ok=True)
         payload = {
             "version": 1,
-            "projects": [p.to_dict() for p in self._projects.values()],
+            "projects": [p.to_dict() for p in self._all_projects()],
             "wheel": {
                 "ids": list(self._wheel_ids),
                 "cursor": self._wheel_cursor,
             },
         }
         tmp = self._path + ".tmp"
-        with open(tmp, "w") as fh:
-            json.dump(payload, fh, indent=2)
+        with open(tmp, "wb") as fh:
+            fh.write(json_dumps(payload))
+            if fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
         os.replace(tmp, self._path)
 
+    def _append_log(self, records):
+        # type: (List[Dict[str, Any]]) -> None
+        with open(self._log_path, "a+b") as fh:
+            fh.seek(0, os.SEEK_END)
+            if fh.tell():
+                # Terminate a torn line so it cannot swallow our record
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    fh.write(b"\n")
+            fh.write(b"".join(json_dumps(rec) + b"\n" for rec in records))
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._log_entries += len(records)
+
+    def _compact(self):
+        # type: () -> None
+        """Fold the log into the snapshot; caller holds the exclusive lock.
+
+        In-memory state is current at this point (flush reloads after any
+        external write), so nobody else's records can be dropped.
+        """
+        # The snapshot must be on disk before the log it replaces is dropped
+        self._save(fsync=True)
+        with open(self._log_path, "wb"):
+            pass
+        self._log_entries = 0
+        self._file_key = self._stat_key()
+
+    def _schedule_save(self, changed=None, deleted=None, wheel=False):
+        # type: (Optional[str], Optional[str], bool) -> None
+        with self._lock:
+            if changed is not None:
+                self._changed_ids[changed] = None
+            if deleted is not None:
+                self._changed_ids.pop(deleted, None)
+                self._deleted_ids.add(deleted)
+            if wheel:
+                self._wheel_changed = True
+            self._dirty = True
+            self._start_flush_timer(_SAVE_DEBOUNCE_SECONDS)
+
+    def _start_flush_timer(self, delay):
+        # type: (float) -> None
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(delay, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self):
+        # type: () -> None
+        """Timer target: flush, or keep the changes and retry later.
+
+        An exception raised here would only reach threading.excepthook, so
+        it is kept in save_error for the UI to report instead.
+        """
+        try:
+            self.flush()
+        except Exception as exc:
+            with self._lock:
+                self.save_error = str(exc) or type(exc).__name__
+                # A mutation since the failure has already scheduled a flush
+                if self._dirty and self._flush_timer is None:
+                    self._start_flush_timer(_SAVE_RETRY_SECONDS)
+
+    def flush(self):
+        # type: () -> None
+        """Append pending changes to the log now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            # Records carry full state, so replaying them twice is harmless
+            records = []  # type: List[Dict[str, Any]]
+            for pid in self._deleted_ids:
+                records.append({"op": "delete", "id": pid})
+            for pid in self._changed_ids:
+                p = self._get(pid)
+                if p is not None:
+                    records.append({"op": "put", "project": p.to_dict()})
+            if self._wheel_changed:
+                records.append(
+                    {
+                        "op": "wheel",
+                        "ids": list(self._wheel_ids),
+                        "cursor": self._wheel_cursor,
+                    }
+                )
+            with self._file_lock(exclusive=True):
+                external = self._stat_key() != self._file_key
+                if records:
+                    self._append_log(records)
+                self._changed_ids.clear()
+                self._deleted_ids.clear()
+                self._wheel_changed = False
+                self._dirty = False
+                if external:
+                    # Someone else wrote since our last load: replay it all,
+                    # our own records included
+                    self._file_key = None
+                    self._load_locked()
+                else:
+                    # Our own append must not look like an external change
+                    self._file_key = self._stat_key()
+                if self._log_entries >= _LOG_COMPACT_ENTRIES:
+                    self._compact()
+            self.save_error = None
+
     # ── adapter implementation ────────────────────────────
+    #
+    # Readers and mutators hold the lock from _load/lookup through the
+    # result, so a flush on the timer thread cannot reload the projects out
+    # from under them.
 
     def list_projects(self):
         # type: () -> List[KanbanProject]
-        self._load()  # re-read for freshness
-        return list(self._projects.values())
+        with self._lock:
+            self._load()  # re-read for freshness
+            return self._all_projects()
 
     def get_project(self, project_id):
         # type: (str) -> Optional[KanbanProject]
-        self._load()
-        return self._projects.get(project_id)
+        with self._lock:
+            self._load()
+            return self._get(project_id)
 
     def create_project(self, title, description="", stage="pending", tags=None):
         # type: (str, str, str, Optional[List[str]]) -> KanbanProject
-        now = _now_iso()
-        project = KanbanProject(
-            id=str(uuid.uuid4())[:8],
-            title=title,
-            description=description,
-            stage=stage if stage in ALL_STAGES else "pending",
-            created_at=now,
-            updated_at=now,
-            tags=tags or [],
-        )
-        self._projects[project.id] = project
-        self._save()
-        return project
+        with self._lock:
+            now = _now_iso()
+            project = KanbanProject(
+                id=str(uuid.uuid4())[:8],
+                title=title,
+                description=description,
+                stage=stage if stage in ALL_STAGE_SET else "pending",
+                created_at=now,
+                updated_at=now,
+                tags=tags or [],
+            )
+            self._projects[project.id] = project
+            self._schedule_save(changed=project.id)
+            return project
 
     def update_project(self, project_id, **kwargs):
         # type: (str, **Any) -> Optional[KanbanProject]
-        p = self._projects.get(project_id)
-        if not p:
-            return None
-        for key in ("title", "description", "tags", "previous_stage"):
-            if key in kwargs:
-                setattr(p, key, kwargs[key])
-        if "stage" in kwargs and kwargs["stage"] in ALL_STAGES:
-            p.stage = kwargs["stage"]
-        p.updated_at = _now_iso()
-        self._save()
-        return p
+        with self._lock:
+            p = self._get(project_id)
+            if not p:
+                return None
+            for key in ("title", "description", "tags", "previous_stage"):
+                if key in kwargs:
+                    setattr(p, key, kwargs[key])
+            if "stage" in kwargs and kwargs["stage"] in ALL_STAGE_SET:
+                p.stage = kwargs["stage"]
+            p.updated_at = _now_iso()
+            self._schedule_save(changed=project_id)
+            return p
 
     def move_project(self, project_id, stage):
         # type: (str, str) -> Optional[KanbanProject]
-        if stage not in ALL_STAGES:
+        if stage not in ALL_STAGE_SET:
             return None
         return self.update_project(project_id, stage=stage)
 
     def delete_project(self, project_id):
         # type: (str) -> bool
-        if project_id in self._projects:
-            del self._projects[project_id]
-            self._save()
-            return True
-        return False
+        with self._lock:
+            if project_id in self._projects:
+                del self._projects[project_id]
+                self._schedule_save(deleted=project_id)
+                return True
+            return False
 
     def link_session(self, project_id, session_id):
         # type: (str, str) -> bool
-        p = self._projects.get(project_id)
-        if not p:
-            return False
-        if session_id not in p.session_ids:
-            p.session_ids.append(session_id)
-            p.updated_at = _now_iso()
-            self._save()
-        return True
+        with self._lock:
+            p = self._get(project_id)
+            if not p:
+                return False
+            if session_id not in p.session_id_set:
+                p.session_id_set.add(session_id)
+                p.session_ids.append(session_id)
+                p.updated_at = _now_iso()
+                self._schedule_save(changed=project_id)
+            return True
 
     def unlink_session(self, project_id, session_id):
         # type: (str, str) -> bool
-        p = self._projects.get(project_id)
-        if not p:
-            return False
-        if session_id in p.session_ids:
-            p.session_ids.remove(session_id)
-            p.updated_at = _now_iso()
-            self._save()
-        return True
+        with self._lock:
+            p = self._get(project_id)
+            if not p:
+                return False
+            if session_id in p.session_id_set:
+                p.session_id_set.discard(session_id)
+                p.session_ids.remove(session_id)
+                p.updated_at = _now_iso()
+                self._schedule_save(changed=project_id)
+            return True
 
     def link_pr(self, project_id, pr_number):
         # type: (str, int) -> bool
-        p = self._projects.get(project_id)
-        if not p:
-            return False
-        if pr_number not in p.pr_numbers:
-            p.pr_numbers.append(pr_number)
-            p.updated_at = _now_iso()
-            self._save()
-        return True
+        with self._lock:
+            p = self._get(project_id)
+            if not p:
+                return False
+            if pr_number not in p.pr_number_set:
+                p.pr_number_set.add(pr_number)
+                p.pr_numbers.append(pr_number)
+                p.updated_at = _now_iso()
+                self._schedule_save(changed=project_id)
+            return True
 
     def unlink_pr(self, project_id, pr_number):
         # type: (str, int) -> bool
-        p = self._projects.get(project_id)
-        if not p:
-            return False
-        if pr_number in p.pr_numbers:
-            p.pr_numbers.remove(pr_number)
-            p.updated_at = _now_iso()
-            self._save()
-        return True
+        with self._lock:
+            p = self._get(project_id)
+            if not p:
+                return False
+            if pr_number in p.pr_number_set:
+                p.pr_number_set.discard(pr_number)
+                p.pr_numbers.remove(pr_number)
+                p.updated_at = _now_iso()
+                self._schedule_save(changed=project_id)
+            return True
 
     # ── wheel implementation ──────────────────────────────
 
     def wheel_list(self):
         # type: () -> List[str]
-        self._load()
-        return list(self._wheel_ids)
+        with self._lock:
+            self._load()
+            return list(self._wheel_ids)
 
     def wheel_add(self, project_id):
         # type: (str) -> bool
-        self._load()
-        if project_id not in self._projects:
-            return False
-        if project_id in self._wheel_ids:
-            return False
-        self._wheel_ids.append(project_id)
-        self._save()
-        return True
+        with self._lock:
+            self._load()
+            if project_id not in self._projects:
+                return False
+            if project_id in self._wheel_ids:
+                return False
+            self._wheel_ids.append(project_id)
+            self._schedule_save(wheel=True)
+            return True
 
     def wheel_remove(self, project_id):
         # type: (str) -> bool
-        self._load()
-        if project_id not in self._wheel_ids:
-            return False
-        idx = self._wheel_ids.index(project_id)
-        self._wheel_ids.remove(project_id)
-        if not self._wheel_ids:
-            self._wheel_cursor = 0
-        elif idx < self._wheel_cursor:
-            self._wheel_cursor -= 1
-        elif self._wheel_cursor >= len(self._wheel_ids):
-            self._wheel_cursor = 0
-        self._save()
-        return True
+        with self._lock:
+            self._load()
+            if project_id not in self._wheel_ids:
+                return False
+            idx = self._wheel_ids.index(project_id)
+            self._wheel_ids.remove(project_id)
+            if not self._wheel_ids:
+                self._wheel_cursor = 0
+            elif idx < self._wheel_cursor:
+                self._wheel_cursor -= 1
+            elif self._wheel_cursor >= len(self._wheel_ids):
+                self._wheel_cursor = 0
+            self._schedule_save(wheel=True)
+            return True
 
     def wheel_next(self):
         # type: () -> Optional[str]
-        self._load()
-        if not self._wheel_ids:
-            return None
-        self._wheel_cursor = (self._wheel_cursor + 1) % len(self._wheel_ids)
-        self._save()
-        return self._wheel_ids[self._wheel_cursor]
+        with self._lock:
+            self._load()
+            if not self._wheel_ids:
+                return None
+            self._wheel_cursor = (self._wheel_cursor + 1) % len(self._wheel_ids)
+            self._schedule_save(wheel=True)
+            return self._wheel_ids[self._wheel_cursor]
 
     def wheel_prev(self):
         # type: () -> Optional[str]
-        self._load()
-        if not self._wheel_ids:
-            return None
-        self._wheel_cursor = (self._wheel_cursor - 1) % len(self._wheel_ids)
-        self._save()
-        return self._wheel_ids[self._wheel_cursor]
+        with self._lock:
+            self._load()
+            if not self._wheel_ids:
+                return None
+            self._wheel_cursor = (self._wheel_cursor - 1) % len(self._wheel_ids)
+            self._schedule_save(wheel=True)
+            return self._wheel_ids[self._wheel_cursor]
 
     def wheel_current(self):
         # type: () -> Optional[str]
-        self._load()
-        if not self._wheel_ids:
-            return None
-        if self._wheel_cursor >= len(self._wheel_ids):
-            self._wheel_cursor = 0
-        return self._wheel_ids[self._wheel_cursor]
+        with self._lock:
+            self._load()
+            if not self._wheel_ids:
+                return None
+            if self._wheel_cursor >= len(self._wheel_ids):
+                self._wheel_cursor = 0
+            return self._wheel_ids[self._wheel_cursor]
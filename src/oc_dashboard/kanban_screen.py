@@ -17,17 +17,20 @@ Keybindings:
 """
 
 import subprocess
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional
 
+from rich.style import Style
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.screen import Screen
-from textual.widgets import DataTable, Input, Static
+from textual.widgets import Input, Static
 
 from .kanban import (
+    STAGE_INDEX,
+    STAGE_SET,
     STAGES,
     STAGE_LABELS,
     KanbanAdapter,
@@ -74,6 +77,13 @@ MODE_ADD_DESC = "add_desc"
 MODE_LINK_SESSION = "link_session"
 MODE_LINK_PR = "link_pr"
 
+_UPDATED_AT = attrgetter("updated_at")
+
+_STYLE_DIM = Style(dim=True)
+_STYLE_CYAN = Style(color="cyan")
+_STYLE_TITLE = Style(color="cyan", bold=True)
+_STYLE_SELECTED = Style(color="green", bold=True)
+
 
 class KanbanScreen(Screen):
     CSS = """
@@ -186,14 +196,24 @@ class KanbanScreen(Screen):
         self._adapter = adapter or LocalJsonKanban()
         self._sessions = sessions or []
         self._prs = prs or []
+        # Detail-pane lookups by linked id; both lists are fixed for the screen
+        self._sessions_by_id = {s.id: s for s in self._sessions}
+        self._prs_by_number = {pr.number: pr for pr in self._prs}
         self._project_path = project_path
         self._col_idx = 0  # which STAGES column is active
         self._row_idx = {}  # type: Dict[str, int]  # stage -> selected row
         for s in STAGES:
             self._row_idx[s] = 0
+        # Column buffers are cleared and refilled, never reallocated
         self._projects_by_stage = {}  # type: Dict[str, List[KanbanProject]]
+        for s in STAGES:
+            self._projects_by_stage[s] = []
+        self._stage_counts = {}  # type: Dict[str, int]
+        self._total_count = 0
         self._mode = MODE_NORMAL
         self._pending_title = ""
+        # widget id -> content last passed to update()
+        self._last_content = {}  # type: Dict[str, object]
 
     def compose(self) -> ComposeResult:
         yield Static("", id="kanban-topbar")
@@ -209,22 +229,43 @@ class KanbanScreen(Screen):
         yield Static("", id="kanban-footer")
 
     def on_mount(self) -> None:
+        self._cache_widgets()
         self._refresh_board()
         self._render_footer()
 
+    def _cache_widgets(self) -> None:
+        # Resolve handles once by id (no selector matching); renders run on
+        # every keypress
+        self._w_topbar = self.get_widget_by_id("kanban-topbar", Static)
+        self._w_detail = self.get_widget_by_id("kanban-detail", Static)
+        self._w_footer = self.get_widget_by_id("kanban-footer", Static)
+        self._w_input_bar = self.get_widget_by_id("kanban-input-bar", Container)
+        self._w_input_label = self.get_widget_by_id("kanban-input-label", Static)
+        self._w_input = self.get_widget_by_id("kanban-input", Input)
+        self._w_titles = {
+            s: self.get_widget_by_id("title-%s" % s, Static) for s in STAGES
+        }
+        self._w_bodies = {
+            s: self.get_widget_by_id("body-%s" % s, Static) for s in STAGES
+        }
+        self._w_cols = {
+            s: self.get_widget_by_id("col-%s" % s, Container) for s in STAGES
+        }
+
     # ── data ──────────────────────────────────────────────
 
     def _refresh_board(self) -> None:
         projects = self._adapter.list_projects()
-        self._projects_by_stage = {}
-        for s in STAGES:
-            self._projects_by_stage[s] = []
+        for items in self._projects_by_stage.values():
+            items.clear()
         for p in projects:
-            stage = p.stage if p.stage in STAGES else "pending"
+            stage = p.stage if p.stage in STAGE_SET else "pending"
             self._projects_by_stage[stage].append(p)
         # Sort each column: most recently updated first
         for s in STAGES:
-            self._projects_by_stage[s].sort(key=lambda p: p.updated_at, reverse=True)
+            items = self._projects_by_stage[s]
+            if len(items) > 1:
+                items.sort(key=_UPDATED_AT, reverse=True)
         # Clamp row indices
         for s in STAGES:
             count = len(self._projects_by_stage[s])
@@ -232,6 +273,10 @@ class KanbanScreen(Screen):
                 self._row_idx[s] = 0
             elif self._row_idx[s] >= count:
                 self._row_idx[s] = count - 1
+        # Counts only change when the board is reloaded
+        self._stage_counts = {s: len(v) for s, v in self._projects_by_stage.items()}
+        self._total_count = sum(self._stage_counts.values())
+        self._render_topbar()
         self._render_all()
 
     def _selected_project(self):
@@ -245,21 +290,42 @@ class KanbanScreen(Screen):
 
     # ── rendering ─────────────────────────────────────────
 
+    def _update_if_changed(self, widget, content):
+        # type: (Static, object) -> None
+        """Skip Static.update (and the repaint it triggers) for identical content."""
+        if self._last_content.get(widget.id) == content:
+            return
+        self._last_content[widget.id] = content
+        widget.update(content)
+
     def _render_all(self) -> None:
-        self._render_topbar()
         for stage in STAGES:
             self._render_column(stage)
         self._render_detail()
         self._highlight_active_column()
 
+    def _render_column_and_detail(self, stage):
+        # type: (str) -> None
+        """Row moved within one column: nothing else on the board changed."""
+        self._render_column(stage)
+        self._render_detail()
+
+    def _render_column_switch(self, prev_stage):
+        # type: (str) -> None
+        """Active column changed: redraw the old and new column only."""
+        self._render_column(prev_stage)
+        self._render_column_and_detail(STAGES[self._col_idx])
+        self._highlight_active_column()
+
     def _render_topbar(self) -> None:
-        total = sum(len(v) for v in self._projects_by_stage.values())
-        active = len(self._projects_by_stage.get("in_progress", []))
-        in_pr = len(self._projects_by_stage.get("pr", []))
-        topbar = self.query_one("#kanban-topbar", Static)
-        topbar.update(
+        total = self._total_count
+        active = self._stage_counts.get("in_progress", 0)
+        in_pr = self._stage_counts.get("pr", 0)
+        topbar = self._w_topbar
+        self._update_if_changed(
+            topbar,
             " %s %s KANBAN BOARD  %s  %d projects  %s  %d active  %s  %d in PR"
-            % (_CLIPBOARD, _TERM, _PIPE, total, _PIPE, active, _PIPE, in_pr)
+            % (_CLIPBOARD, _TERM, _PIPE, total, _PIPE, active, _PIPE, in_pr),
         )
 
     def _render_column(self, stage):
@@ -270,122 +336,136 @@ class KanbanScreen(Screen):
         is_active = STAGES[self._col_idx] == stage
         row_sel = self._row_idx.get(stage, 0)
 
-        title_widget = self.query_one("#title-%s" % stage, Static)
-        title_widget.update(" %s %s (%d)" % (icon, STAGE_LABELS[stage], count))
+        title_widget = self._w_titles[stage]
+        self._update_if_changed(
+            title_widget, " %s %s (%d)" % (icon, STAGE_LABELS[stage], count)
+        )
 
-        lines = []  # type: list
+        body = Text()
         if not items:
-            lines.append("  [dim]empty[/]")
-        else:
-            for i, project in enumerate(items):
-                prefix = "[bold green]>[/] " if (is_active and i == row_sel) else "  "
-                title = project.title
-                if len(title) > 28:
-                    title = title[:25] + "..."
-                # Show session/PR counts inline
-                meta_parts = []
-                if project.session_ids:
-                    meta_parts.append("%d sess" % len(project.session_ids))
-                if project.pr_numbers:
-                    meta_parts.append("%d PR" % len(project.pr_numbers))
-                meta = " [dim](%s)[/]" % ", ".join(meta_parts) if meta_parts else ""
-
-                if is_active and i == row_sel:
-                    lines.append("%s[bold green]%s[/]%s" % (prefix, title, meta))
-                else:
-                    lines.append("%s%s%s" % (prefix, title, meta))
-
-        body_widget = self.query_one("#body-%s" % stage, Static)
-        body_widget.update("\n".join(lines))
+            body.append("  ")
+            body.append("empty", style=_STYLE_DIM)
+        for i, project in enumerate(items):
+            if i:
+                body.append("\n")
+            title = project.title
+            if len(title) > 28:
+                title = title[:25] + "..."
+            if is_active and i == row_sel:
+                body.append(">", style=_STYLE_SELECTED)
+                body.append(" ")
+                body.append(title, style=_STYLE_SELECTED)
+            else:
+                body.append("  ")
+                body.append(title)
+            # Show session/PR counts inline
+            meta_parts = []
+            if project.session_ids:
+                meta_parts.append("%d sess" % len(project.session_ids))
+            if project.pr_numbers:
+                meta_parts.append("%d PR" % len(project.pr_numbers))
+            if meta_parts:
+                body.append(" ")
+                body.append("(%s)" % ", ".join(meta_parts), style=_STYLE_DIM)
+
+        body_widget = self._w_bodies[stage]
+        self._update_if_changed(body_widget, body)
 
     def _render_detail(self) -> None:
-        detail = self.query_one("#kanban-detail", Static)
+        detail = self._w_detail
         project = self._selected_project()
         if not project:
-            detail.update(" [dim]No project selected. Press 'a' to create one.[/]")
+            self._update_if_changed(
+                detail,
+                Text.assemble(
+                    " ", ("No project selected. Press 'a' to create one.", _STYLE_DIM)
+                ),
+            )
             return
 
-        lines = []  # type: list
-        lines.append(
-            " [bold cyan]%s[/]  [dim]%s[/]  [dim]id:%s[/]"
-            % (
-                project.title,
-                STAGE_LABELS.get(project.stage, project.stage),
-                project.id,
-            )
-        )
+        text = Text(" ")
+        text.append(project.title, style=_STYLE_TITLE)
+        text.append("  ")
+        text.append(STAGE_LABELS.get(project.stage, project.stage), style=_STYLE_DIM)
+        text.append("  ")
+        text.append("id:%s" % project.id, style=_STYLE_DIM)
         if project.description:
-            lines.append(" [dim]%s[/]" % project.description[:80])
+            text.append("\n ")
+            text.append(project.description[:80], style=_STYLE_DIM)
 
         # Sessions
+        text.append("\n")
         if project.session_ids:
-            sess_parts = []
-            for sid in project.session_ids[:5]:
+            text.append(" %s Sessions: " % _TERM)
+            for i, sid in enumerate(project.session_ids[:5]):
                 # Try to find title from dashboard sessions
-                title = sid[:12]
-                for s in self._sessions:
-                    if s.id == sid:
-                        title = s.title[:20]
-                        break
-                sess_parts.append("[cyan]%s[/]" % title)
-            sess_line = " %s Sessions: %s" % (_TERM, "  ".join(sess_parts))
+                session = self._sessions_by_id.get(sid)
+                title = session.title[:20] if session else sid[:12]
+                if i:
+                    text.append("  ")
+                text.append(title, style=_STYLE_CYAN)
             if len(project.session_ids) > 5:
-                sess_line += "  [dim]+%d more[/]" % (len(project.session_ids) - 5)
-            lines.append(sess_line)
+                text.append("  ")
+                text.append(
+                    "+%d more" % (len(project.session_ids) - 5), style=_STYLE_DIM
+                )
         else:
-            lines.append(" [dim]No sessions linked. Press 's' to link one.[/]")
+            text.append(" ")
+            text.append("No sessions linked. Press 's' to link one.", style=_STYLE_DIM)
 
         # PRs
         if project.pr_numbers:
-            pr_parts = []
-            for num in project.pr_numbers[:5]:
+            text.append("\n %s PRs: " % _FORK)
+            for i, num in enumerate(project.pr_numbers[:5]):
                 # Try to find PR status from dashboard PRs
-                status = ""
-                for pr in self._prs:
-                    if pr.number == num:
-                        status = " %s" % pr.ci_status
-                        break
-                pr_parts.append("[cyan]#%d[/]%s" % (num, status))
-            lines.append(" %s PRs: %s" % (_FORK, "  ".join(pr_parts)))
+                pr = self._prs_by_number.get(num)
+                status = " %s" % pr.ci_status if pr else ""
+                if i:
+                    text.append("  ")
+                text.append("#%d" % num, style=_STYLE_CYAN)
+                text.append(status)
 
         # Tags
         if project.tags:
-            lines.append(
-                " %s %s" % (_TAG, "  ".join("[dim]%s[/]" % t for t in project.tags))
-            )
+            text.append("\n %s " % _TAG)
+            for i, t in enumerate(project.tags):
+                if i:
+                    text.append("  ")
+                text.append(t, style=_STYLE_DIM)
 
-        detail.update("\n".join(lines))
+        self._update_if_changed(detail, text)
 
     def _highlight_active_column(self) -> None:
         for i, stage in enumerate(STAGES):
-            col = self.query_one("#col-%s" % stage, Container)
+            col = self._w_cols[stage]
             if i == self._col_idx:
                 col.add_class("active-column")
             else:
                 col.remove_class("active-column")
 
     def _render_footer(self) -> None:
-        footer = self.query_one("#kanban-footer", Static)
-        footer.update(
+        footer = self._w_footer
+        self._update_if_changed(
+            footer,
             " esc:back %s h/l:columns %s j/k:projects %s m:move %s a:add %s s:link-session %s p:link-pr %s d:delete %s enter:open"
-            % (_PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE)
+            % (_PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE, _PIPE),
         )
 
     # ── input bar ─────────────────────────────────────────
 
     def _show_input(self, label, placeholder=""):
         # type: (str, str) -> None
-        bar = self.query_one("#kanban-input-bar", Container)
+        bar = self._w_input_bar
         bar.add_class("visible")
-        lbl = self.query_one("#kanban-input-label", Static)
+        lbl = self._w_input_label
         lbl.update(" %s" % label)
-        inp = self.query_one("#kanban-input", Input)
+        inp = self._w_input
         inp.value = ""
         inp.placeholder = placeholder
         inp.focus()
 
     def _hide_input(self) -> None:
-        bar = self.query_one("#kanban-input-bar", Container)
+        bar = self._w_input_bar
         bar.remove_class("visible")
         self._mode = MODE_NORMAL
 
@@ -473,15 +553,17 @@ class KanbanScreen(Screen):
         if self._mode != MODE_NORMAL:
             return
         if self._col_idx > 0:
+            prev_stage = STAGES[self._col_idx]
             self._col_idx -= 1
-            self._render_all()
+            self._render_column_switch(prev_stage)
 
     def action_col_right(self) -> None:
         if self._mode != MODE_NORMAL:
             return
         if self._col_idx < len(STAGES) - 1:
+            prev_stage = STAGES[self._col_idx]
             self._col_idx += 1
-            self._render_all()
+            self._render_column_switch(prev_stage)
 
     def action_item_down(self) -> None:
         if self._mode != MODE_NORMAL:
@@ -490,7 +572,7 @@ class KanbanScreen(Screen):
         count = len(self._projects_by_stage.get(stage, []))
         if count > 0 and self._row_idx[stage] < count - 1:
             self._row_idx[stage] += 1
-            self._render_all()
+            self._render_column_and_detail(stage)
 
     def action_item_up(self) -> None:
         if self._mode != MODE_NORMAL:
@@ -498,7 +580,7 @@ class KanbanScreen(Screen):
         stage = STAGES[self._col_idx]
         if self._row_idx[stage] > 0:
             self._row_idx[stage] -= 1
-            self._render_all()
+            self._render_column_and_detail(stage)
 
     def action_move_right(self) -> None:
         if self._mode != MODE_NORMAL:
@@ -506,7 +588,7 @@ class KanbanScreen(Screen):
         project = self._selected_project()
         if not project:
             return
-        idx = STAGES.index(project.stage)
+        idx = STAGE_INDEX[project.stage]
         if idx < len(STAGES) - 1:
             self._adapter.move_project(project.id, STAGES[idx + 1])
             self._refresh_board()
@@ -517,7 +599,7 @@ class KanbanScreen(Screen):
         project = self._selected_project()
         if not project:
             return
-        idx = STAGES.index(project.stage)
+        idx = STAGE_INDEX[project.stage]
         if idx > 0:
             self._adapter.move_project(project.id, STAGES[idx - 1])
             self._refresh_board()
@@ -584,6 +666,8 @@ def _launch_session_in_tmux(session_id, project_path=None):
                 ["tmux", "split-window", "-h", "-l", "50%", oc_cmd],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True,
             )
         except Exception:
             pass
@@ -596,6 +680,8 @@ def _launch_session_in_tmux(session_id, project_path=None):
                 ["osascript", "-e", apple_script],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True,
             )
         except Exception:
             pass
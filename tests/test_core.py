@@ -354,6 +354,14 @@ class TestApplySnapshot:
         dash._apply_snapshot(snapshot)
         assert dash.state.project_path == "/tmp/fake"
 
+    def test_versions_bump_on_reload(self):
+        dash, _, _ = _make_dashboard()
+        dash._apply_snapshot(_make_snapshot())
+        dash._apply_snapshot(_make_snapshot())
+        dash.refresh_kanban()
+        assert dash.state.snapshot_version == 2
+        assert dash.state.kanban_version == 1
+
 
 # ── Tests: Kanban operations ─────────────────────────────
 
@@ -609,7 +617,7 @@ class TestInitBranch:
     def test_sets_branch_from_git(self, mock_run):
         dash, _, _ = _make_dashboard()
         dash.state.project_path = "/tmp/repo"
-        mock_run.return_value = MagicMock(returncode=0, stdout="feature/auth\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"feature/auth\n")
         dash.init_branch()
         assert dash.state.current_branch == "feature/auth"
 
@@ -617,7 +625,7 @@ class TestInitBranch:
     def test_ignores_head(self, mock_run):
         dash, _, _ = _make_dashboard()
         dash.state.project_path = "/tmp/repo"
-        mock_run.return_value = MagicMock(returncode=0, stdout="HEAD\n")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"HEAD\n")
         dash.init_branch()
         assert dash.state.current_branch == ""
 
@@ -625,7 +633,7 @@ class TestInitBranch:
     def test_handles_git_failure(self, mock_run):
         dash, _, _ = _make_dashboard()
         dash.state.project_path = "/tmp/repo"
-        mock_run.return_value = MagicMock(returncode=128, stdout="")
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"")
         dash.init_branch()
         assert dash.state.current_branch == ""
 
@@ -637,6 +645,52 @@ class TestInitBranch:
         dash.init_branch()
         assert dash.state.current_branch == ""
 
+    @patch("oc_dashboard.core.subprocess.run")
+    def test_reads_head_file_without_git(self, mock_run, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
+        dash, _, _ = _make_dashboard()
+        dash.state.project_path = str(tmp_path)
+        dash.init_branch()
+        assert dash.state.current_branch == "feature/x"
+        mock_run.assert_not_called()
+
+    @patch("oc_dashboard.core.subprocess.run")
+    def test_follows_worktree_gitdir(self, mock_run, tmp_path):
+        git_dir = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/wt-branch\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: %s\n" % git_dir)
+        dash, _, _ = _make_dashboard()
+        dash.state.project_path = str(worktree)
+        dash.init_branch()
+        assert dash.state.current_branch == "wt-branch"
+        mock_run.assert_not_called()
+
+    @patch("oc_dashboard.core.subprocess.run")
+    def test_detached_head_file(self, mock_run, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("0123456789abcdef\n")
+        dash, _, _ = _make_dashboard()
+        dash.state.project_path = str(tmp_path)
+        dash.init_branch()
+        assert dash.state.current_branch == ""
+        mock_run.assert_not_called()
+
+    @patch("oc_dashboard.core.subprocess.run")
+    def test_git_failure_keeps_branch_for_retry(self, mock_run):
+        dash, _, _ = _make_dashboard()
+        dash.state.project_path = "/tmp/repo"
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"")
+        dash.init_branch()
+        assert dash.state.current_branch == ""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"main\n")
+        dash.init_branch()
+        assert dash.state.current_branch == "main"
+        assert mock_run.call_count == 2
+
 
 # ── Tests: Archive / Restore ─────────────────────────────
 
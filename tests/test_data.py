@@ -0,0 +1,329 @@
+import json
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from oc_dashboard import data
+from oc_dashboard.data import (
+    CI_FAIL,
+    CI_PASS,
+    CI_PENDING,
+    REVIEW_STATUS_DEFAULT,
+    REVIEW_STATUS_LABELS,
+    fetch_prs,
+    fetch_worktrees,
+    fetch_session_costs,
+    fetch_sessions,
+)
+
+_SCHEMA = """
+CREATE TABLE project (id TEXT PRIMARY KEY, worktree TEXT);
+CREATE TABLE session (
+  id TEXT PRIMARY KEY, project_id TEXT, parent_id TEXT, title TEXT,
+  directory TEXT, time_created INTEGER, time_updated INTEGER,
+  time_archived INTEGER
+);
+CREATE TABLE todo (session_id TEXT, content TEXT, status TEXT, position INTEGER);
+CREATE TABLE message (id TEXT PRIMARY KEY, session_id TEXT, time_created INTEGER, data TEXT);
+"""
+
+_BASE_MS = 1760000000000
+
+
+@pytest.fixture
+def opencode_db(tmp_path, monkeypatch):
+    path = str(tmp_path / "opencode.db")
+    connection = sqlite3.connect(path)
+    connection.executescript(_SCHEMA)
+    monkeypatch.setattr(data, "DB_PATH", path)
+    data._reset_pool()
+    yield connection
+    connection.close()
+    data._reset_pool()
+
+
+def _session(
+    db, sid, title, directory="/work/repo", minutes=0, parent=None, archived=None
+):
+    updated = _BASE_MS + minutes * 60000
+    db.execute(
+        "INSERT INTO session VALUES (?, 'p', ?, ?, ?, ?, ?, ?)",
+        (sid, parent, title, directory, updated, updated, archived),
+    )
+
+
+def _todo(db, sid, status, count=1):
+    for i in range(count):
+        db.execute(
+            "INSERT INTO todo VALUES (?, ?, ?, ?)",
+            (sid, "%s %d" % (status, i), status, i),
+        )
+
+
+def _message(db, mid, sid, role, cost):
+    db.execute(
+        "INSERT INTO message VALUES (?, ?, 0, ?)",
+        (mid, sid, '{"role": "%s", "cost": %s}' % (role, cost)),
+    )
+
+
+def _rows(sessions):
+    return [(s.id, s.depth, s.parent_id) for s in sessions]
+
+
+class TestFetchSessions:
+    def test_empty_database(self, opencode_db):
+        assert fetch_sessions(30) == []
+
+    def test_todo_counts_per_status(self, opencode_db):
+        _session(opencode_db, "s1", "Busy")
+        _session(opencode_db, "s2", "Idle", minutes=-1)
+        _todo(opencode_db, "s1", "pending", 3)
+        _todo(opencode_db, "s1", "in_progress")
+        _todo(opencode_db, "s1", "completed", 2)
+        _todo(opencode_db, "s1", "cancelled")
+        opencode_db.commit()
+
+        by_id = {s.id: s for s in fetch_sessions(30)}
+        busy = by_id["s1"]
+        assert busy.pending == 3
+        assert busy.in_progress == 1
+        assert busy.completed == 2
+        assert busy.cancelled == 1
+        assert busy.total == 7
+        assert by_id["s2"].total == 0
+
+    def test_child_and_archived_sessions_are_skipped(self, opencode_db):
+        _session(opencode_db, "root", "Root")
+        _session(opencode_db, "child", "Subagent", minutes=5, parent="root")
+        _session(opencode_db, "old", "Archived", minutes=9, archived=_BASE_MS)
+        opencode_db.commit()
+
+        assert _rows(fetch_sessions(30)) == [
+            ("group:/work/repo", 0, None),
+            ("root", 1, None),
+        ]
+
+    def test_blank_title_is_untitled(self, opencode_db):
+        _session(opencode_db, "s1", "")
+        _session(opencode_db, "s2", None, minutes=-1)
+        opencode_db.commit()
+
+        assert [s.title for s in fetch_sessions(30)[1:]] == ["(untitled)", "(untitled)"]
+
+    def test_forks_nest_under_original(self, opencode_db):
+        _session(opencode_db, "orig", "Alpha")
+        _session(opencode_db, "tab", "Alpha\t (fork #1)", minutes=2)
+        _session(opencode_db, "nl", "Alpha (fork #2)\n", minutes=1)
+        _session(opencode_db, "orphan", "Gamma (fork #1)", minutes=3)
+        _session(opencode_db, "not_fork", "Alpha (fork #1x)", minutes=-1)
+        opencode_db.commit()
+
+        assert _rows(fetch_sessions(30)) == [
+            ("group:/work/repo", 0, None),
+            ("orphan", 1, None),
+            ("orig", 1, None),
+            ("tab", 2, "orig"),
+            ("nl", 2, "orig"),
+            ("not_fork", 1, None),
+        ]
+
+    def test_repo_blocks_ordered_by_recency(self, opencode_db):
+        _session(opencode_db, "a1", "Old repo", directory="/work/a", minutes=1)
+        _session(opencode_db, "b1", "New repo", directory="/work/b", minutes=5)
+        _session(opencode_db, "a2", "Old repo again", directory="/work/a")
+        opencode_db.commit()
+
+        sessions = fetch_sessions(30)
+        assert _rows(sessions) == [
+            ("group:/work/b", 0, None),
+            ("b1", 1, None),
+            ("group:/work/a", 0, None),
+            ("a1", 1, None),
+            ("a2", 1, None),
+        ]
+        assert sessions[0].title == "b"
+
+    def test_limit_keeps_most_recent_roots(self, opencode_db):
+        for i in range(5):
+            _session(opencode_db, "s%d" % i, "Session %d" % i, minutes=i)
+        opencode_db.commit()
+
+        assert [s.id for s in fetch_sessions(2)[1:]] == ["s4", "s3"]
+
+
+class TestFetchSessionCosts:
+    def test_sums_direct_and_child_costs(self, opencode_db):
+        _session(opencode_db, "root", "Root")
+        _session(opencode_db, "child", "Subagent", parent="root")
+        _session(opencode_db, "cheap", "Cheap")
+        _message(opencode_db, "m1", "root", "assistant", 0.25)
+        _message(opencode_db, "m2", "root", "assistant", 0.5)
+        _message(opencode_db, "m3", "child", "assistant", 1.125)
+        _message(opencode_db, "m4", "root", "user", 9)
+        _message(opencode_db, "m5", "cheap", "assistant", 0.01)
+        opencode_db.commit()
+
+        costs = fetch_session_costs()
+        assert [(c.session_id, c.title) for c in costs] == [
+            ("root", "Root"),
+            ("cheap", "Cheap"),
+        ]
+        assert costs[0].direct_cost == pytest.approx(0.75)
+        assert costs[0].child_cost == pytest.approx(1.125)
+        assert costs[0].total_cost == pytest.approx(1.875)
+        assert costs[1].child_cost == 0
+
+    def test_sessions_without_spend_are_omitted(self, opencode_db):
+        _session(opencode_db, "free", "Free")
+        _message(opencode_db, "m1", "free", "assistant", 0)
+        opencode_db.commit()
+
+        assert fetch_session_costs() == []
+
+
+def _check_run(status, conclusion=None):
+    return {"__typename": "CheckRun", "status": status, "conclusion": conclusion}
+
+
+def _status_context(state):
+    return {"__typename": "StatusContext", "state": state}
+
+
+def _pr_node(number, contexts, review=None):
+    rollup = None if contexts is None else {"contexts": {"nodes": contexts}}
+    return {
+        "number": number,
+        "title": "PR %d" % number,
+        "state": "OPEN",
+        "headRefName": "branch-%d" % number,
+        "updatedAt": "2026-01-01T00:00:00Z",
+        "url": "https://example.com/pull/%d" % number,
+        "reviewDecision": review,
+        "commits": {"nodes": [{"commit": {"statusCheckRollup": rollup}}]},
+    }
+
+
+def _gh_result(nodes, returncode=0):
+    payload = {"data": {"search": {"nodes": nodes}}}
+    return MagicMock(returncode=returncode, stdout=json.dumps(payload).encode())
+
+
+class TestFetchPrs:
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_single_graphql_call(self, mock_run):
+        mock_run.return_value = _gh_result([])
+        assert fetch_prs("/work/repo") == []
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ["gh", "api", "graphql"]
+        assert "search=" + data._PR_SEARCH in args
+        assert mock_run.call_args[1]["cwd"] == "/work/repo"
+
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_ci_status_from_rollup(self, mock_run):
+        mock_run.return_value = _gh_result(
+            [
+                _pr_node(
+                    1,
+                    [
+                        _check_run("COMPLETED", "SUCCESS"),
+                        _check_run("COMPLETED", "SKIPPED"),
+                        _status_context("SUCCESS"),
+                    ],
+                    review="APPROVED",
+                ),
+                _pr_node(
+                    2,
+                    [_check_run("IN_PROGRESS"), _check_run("COMPLETED", "FAILURE")],
+                ),
+                _pr_node(3, [_check_run("QUEUED"), _status_context("SUCCESS")]),
+                _pr_node(4, [_status_context("PENDING")]),
+                _pr_node(5, [_status_context("ERROR")]),
+                _pr_node(6, None, review="CHANGES_REQUESTED"),
+                _pr_node(7, []),
+                {},
+            ]
+        )
+        prs = fetch_prs()
+        assert [(p.number, p.ci_status) for p in prs] == [
+            (1, CI_PASS),
+            (2, CI_FAIL),
+            (3, CI_PENDING),
+            (4, CI_PENDING),
+            (5, CI_FAIL),
+            (6, CI_PENDING),
+            (7, CI_PENDING),
+        ]
+        assert prs[0].review_status == REVIEW_STATUS_LABELS["APPROVED"]
+        assert prs[1].review_status == REVIEW_STATUS_DEFAULT
+        assert prs[5].review_status == REVIEW_STATUS_LABELS["CHANGES_REQUESTED"]
+        assert prs[0].head_ref == "branch-1"
+
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_gh_failure(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"")
+        assert fetch_prs() == []
+
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_malformed_payload(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"errors": []}')
+        assert fetch_prs() == []
+
+
+_WORKTREE_PORCELAIN = """\
+worktree /work/bare.git
+bare
+
+worktree /work/main
+HEAD 1111111111111111111111111111111111111111
+branch refs/heads/main
+
+worktree /work/feature
+HEAD 2222222222222222222222222222222222222222
+branch refs/heads/feature/auth
+
+worktree /work/detached
+HEAD 3333333333333333333333333333333333333333
+detached
+
+worktree /work/gone
+HEAD 4444444444444444444444444444444444444444
+branch refs/heads/gone
+prunable gitdir file points to non-existent location
+
+"""
+
+
+class TestFetchWorktrees:
+    def test_no_project_path(self):
+        assert fetch_worktrees(None) == []
+
+    @patch("oc_dashboard.data.subprocess.Popen")
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_parses_porcelain_blocks(self, mock_run, mock_popen):
+        mock_run.return_value = MagicMock(returncode=0, stdout=_WORKTREE_PORCELAIN)
+        dirty_paths = {"/work/feature"}
+
+        def spawn(args, **kwargs):
+            path = args[args.index("-C") + 1]
+            proc = MagicMock()
+            proc.wait.return_value = 1 if path in dirty_paths else 0
+            return proc
+
+        mock_popen.side_effect = spawn
+        worktrees = fetch_worktrees("/work/main")
+
+        assert [(w.path, w.branch, w.dirty) for w in worktrees] == [
+            ("/work/main", "main", False),
+            ("/work/feature", "feature/auth", True),
+        ]
+        # Bare, detached and prunable entries are never checked for changes
+        checked = [c[0][0][c[0][0].index("-C") + 1] for c in mock_popen.call_args_list]
+        assert checked == ["/work/main", "/work/feature"]
+
+    @patch("oc_dashboard.data.subprocess.run")
+    def test_git_failure(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=128, stdout="")
+        assert fetch_worktrees("/work/main") == []
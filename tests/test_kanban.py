@@ -0,0 +1,215 @@
+import json
+import sys
+import threading
+
+import pytest
+
+from oc_dashboard import kanban
+from oc_dashboard.kanban import LocalJsonKanban
+
+
+@pytest.fixture
+def board_path(tmp_path):
+    return str(tmp_path / "kanban.json")
+
+
+def _log_records(path):
+    with open(path + ".log", "rb") as fh:
+        return [json.loads(line) for line in fh.read().splitlines() if line]
+
+
+class TestLocalJsonKanbanLog:
+    def test_changes_replay_from_log(self, board_path):
+        k = LocalJsonKanban(board_path)
+        a = k.create_project("Alpha", stage="in_progress", tags=["x"])
+        b = k.create_project("Beta")
+        k.link_session(a.id, "ses_1")
+        k.link_pr(b.id, 42)
+        k.wheel_add(a.id)
+        k.wheel_add(b.id)
+        k.wheel_next()
+        k.flush()
+
+        ops = [rec["op"] for rec in _log_records(board_path)]
+        assert sorted(ops) == ["put", "put", "wheel"]
+
+        fresh = LocalJsonKanban(board_path)
+        assert [p.to_dict() for p in fresh.list_projects()] == [
+            p.to_dict() for p in k.list_projects()
+        ]
+        assert fresh.wheel_list() == [a.id, b.id]
+        assert fresh.wheel_current() == b.id
+        assert fresh.get_project(a.id).session_ids == ["ses_1"]
+
+    def test_delete_record_removes_project(self, board_path):
+        k = LocalJsonKanban(board_path)
+        keep = k.create_project("Keep")
+        gone = k.create_project("Gone")
+        k.flush()
+        k.delete_project(gone.id)
+        k.flush()
+
+        assert _log_records(board_path)[-1] == {"op": "delete", "id": gone.id}
+        fresh = LocalJsonKanban(board_path)
+        assert [p.id for p in fresh.list_projects()] == [keep.id]
+
+    def test_torn_last_line_is_skipped(self, board_path):
+        k = LocalJsonKanban(board_path)
+        first = k.create_project("First")
+        k.flush()
+        with open(board_path + ".log", "ab") as fh:
+            fh.write(b'{"op":"put","proj')
+
+        survivor = LocalJsonKanban(board_path)
+        assert [p.id for p in survivor.list_projects()] == [first.id]
+
+        # The next append must not be glued onto the torn fragment
+        second = survivor.create_project("Second")
+        survivor.flush()
+        fresh = LocalJsonKanban(board_path)
+        assert [p.id for p in fresh.list_projects()] == [first.id, second.id]
+
+    def test_compaction_folds_log_into_snapshot(self, board_path, monkeypatch):
+        monkeypatch.setattr(kanban, "_LOG_COMPACT_ENTRIES", 5)
+        k = LocalJsonKanban(board_path)
+        p = k.create_project("Busy")
+        for i in range(5):
+            k.update_project(p.id, title="Busy %d" % i)
+            k.flush()
+
+        with open(board_path + ".log", "rb") as fh:
+            assert fh.read() == b""
+        with open(board_path, "rb") as fh:
+            snapshot = json.loads(fh.read())
+        assert [d["title"] for d in snapshot["projects"]] == ["Busy 4"]
+        assert LocalJsonKanban(board_path).get_project(p.id).title == "Busy 4"
+
+    def test_compaction_keeps_other_writers_records(self, board_path, monkeypatch):
+        monkeypatch.setattr(kanban, "_LOG_COMPACT_ENTRIES", 3)
+        tui = LocalJsonKanban(board_path)
+        cli = LocalJsonKanban(board_path)
+        from_cli = cli.create_project("From CLI")
+        cli.flush()
+
+        # tui has not re-read the files; its flush compacts
+        a = tui.create_project("A")
+        b = tui.create_project("B")
+        tui.flush()
+
+        fresh = LocalJsonKanban(board_path)
+        assert {p.id for p in fresh.list_projects()} == {from_cli.id, a.id, b.id}
+        assert {p.id for p in tui.list_projects()} == {from_cli.id, a.id, b.id}
+
+    def test_compaction_keeps_live_objects(self, board_path, monkeypatch):
+        # A mutator holding a project across a timer-thread compaction must
+        # not be left editing a discarded copy
+        monkeypatch.setattr(kanban, "_LOG_COMPACT_ENTRIES", 2)
+        k = LocalJsonKanban(board_path)
+        p = k.create_project("Held")
+        k.create_project("Other")
+        k.flush()
+
+        assert k.get_project(p.id) is p
+        k.update_project(p.id, title="Edited")
+        k.flush()
+        assert LocalJsonKanban(board_path).get_project(p.id).title == "Edited"
+
+    def test_readers_never_see_a_half_loaded_board(self, board_path):
+        tui = LocalJsonKanban(board_path)
+        for i in range(200):
+            tui.create_project("Seed %d" % i)
+        tui.flush()
+        cli = LocalJsonKanban(board_path)
+        seeded = len(tui.list_projects())
+        stop = threading.Event()
+        errors = []
+
+        def flusher():
+            # Each tui flush finds the cli's append and reloads the board
+            try:
+                while not stop.is_set():
+                    cli.create_project("From CLI")
+                    cli.flush()
+                    tui.create_project("From TUI")
+                    tui.flush()
+            except Exception as exc:
+                errors.append(exc)
+
+        # Switch threads often so reads land inside a reload
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        thread = threading.Thread(target=flusher)
+        thread.start()
+        try:
+            for _ in range(3000):
+                projects = tui.list_projects()
+                assert len(projects) >= seeded
+                assert all(p is not None for p in projects)
+        finally:
+            stop.set()
+            thread.join()
+            sys.setswitchinterval(interval)
+        assert errors == []
+
+
+class TestLocalJsonKanbanSaveErrors:
+    @pytest.fixture
+    def failing(self, monkeypatch):
+        """Adapters in the returned set fail to append, as on a full disk."""
+        broken = set()
+        append_log = LocalJsonKanban._append_log
+
+        def append(self, records):
+            if self in broken:
+                raise OSError(28, "No space left on device")
+            append_log(self, records)
+
+        monkeypatch.setattr(kanban, "_SAVE_RETRY_SECONDS", 3600)
+        monkeypatch.setattr(LocalJsonKanban, "_append_log", append)
+        return broken
+
+    def test_explicit_flush_raises(self, board_path, failing):
+        k = LocalJsonKanban(board_path)
+        failing.add(k)
+        k.create_project("Unsaved")
+        with pytest.raises(OSError):
+            k.flush()
+
+    def test_timer_flush_records_error_and_retries(self, board_path, failing):
+        k = LocalJsonKanban(board_path)
+        failing.add(k)
+        p = k.create_project("Unsaved")
+        k._flush_from_timer()
+
+        assert "No space left" in k.save_error
+        assert k._flush_timer is not None  # retry scheduled
+        assert k.get_project(p.id).title == "Unsaved"
+
+        failing.discard(k)
+        k._flush_from_timer()
+        assert k.save_error is None
+        assert k._flush_timer is None
+        assert [q.id for q in LocalJsonKanban(board_path).list_projects()] == [p.id]
+
+    def test_failed_save_still_sees_other_writers(self, board_path, failing):
+        k = LocalJsonKanban(board_path)
+        kept = k.create_project("Kept")
+        k.flush()
+        failing.add(k)
+        k.update_project(kept.id, title="Kept, edited")
+        local = k.create_project("Local")
+        k._flush_from_timer()
+        k._flush_timer.cancel()
+
+        other = LocalJsonKanban(board_path)
+        other.create_project("Other")
+        other.flush()
+
+        titles = sorted(q.title for q in k.list_projects())
+        assert titles == ["Kept, edited", "Local", "Other"]
+        assert k.get_project(local.id) is local
+
+        failing.discard(k)
+        k.flush()
+        fresh = LocalJsonKanban(board_path)
+        assert sorted(q.title for q in fresh.list_projects()) == titles